@@ -24,6 +24,14 @@ import tempfile
 import time
 import urllib.error
 import urllib.request
+from collections import deque
+
+# orjson is optional; it parses/serializes the larger JSON files several times faster
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -37,6 +45,7 @@ LOCK_PATH = os.path.join(AETHERVAULT_HOME, "data", "hot-memories.lock")
 ARCHIVE_PATH = os.path.join(AETHERVAULT_HOME, "data", "hot-memories-archive.jsonl")
 HEALTH_PATH = os.path.join(AETHERVAULT_HOME, "data", "memory-health.json")
 FAILURE_PATH = os.path.join(AETHERVAULT_HOME, "data", "extractor-failures.json")
+RECENT_ADDS_PATH = os.path.join(AETHERVAULT_HOME, "data", "recent-adds.json")
 ENV_FILE = os.path.join(AETHERVAULT_HOME, ".env")
 OWNER_NAME = os.environ.get("OWNER_NAME", "the user")
 
@@ -45,6 +54,8 @@ MAX_HOT_MEMORIES = 200
 MAX_PINNED_MEMORIES = 50
 MAX_ARCHIVE_LINES = 10000
 TEMP_FILE_MAX_AGE_SECONDS = 600  # 10 min
+RECENT_ADDS_WINDOW_SECONDS = 3600  # sliding window kept in recent-adds.json
+MAX_RECENT_ADDS = 1000
 MIN_DISK_FREE_MB = 100  # don't write if less than this free
 
 # FadeMem decay parameters
@@ -68,6 +79,37 @@ MAX_RETRIES = 2
 RETRY_DELAY_SECONDS = 3
 
 
+# ---------------------------------------------------------------------------
+# JSON helpers (orjson when available, stdlib json otherwise)
+# ---------------------------------------------------------------------------
+
+def json_loads(data):
+    """Parse JSON from str or bytes. Raises json.JSONDecodeError on bad input."""
+    if HAS_ORJSON:
+        return orjson.loads(data)  # orjson.JSONDecodeError subclasses json's
+    return json.loads(data)
+
+
+def json_dumps(data, default=None) -> bytes:
+    """Serialize data as compact, single-line JSON (UTF-8 bytes)."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, default=default)
+    return json.dumps(data, separators=(",", ":"), default=default).encode("utf-8")
+
+
+def json_dumps_indented(data, default=None) -> bytes:
+    """Serialize data as 2-space indented JSON (UTF-8 bytes)."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=default)
+    return json.dumps(data, indent=2, default=default).encode("utf-8")
+
+
+def load_json_file(filepath: str):
+    """Read and parse a whole JSON file."""
+    with open(filepath, "rb") as f:
+        return json_loads(f.read())
+
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -157,36 +199,93 @@ def hot_memory_unlock(fd):
 # Hot memory read/write (single source of truth)
 # ---------------------------------------------------------------------------
 
-def read_hot_memories() -> list:
-    """Read hot memories from JSONL file.
+def _intern_memory(mem):
+    """Intern a parsed memory's fact text and dict keys.
+
+    Every JSONL line is parsed separately, so identical facts and the
+    repeated metadata keys would otherwise each be a distinct str object.
+    """
+    if not isinstance(mem, dict):
+        return mem
+    intern = sys.intern
+    fact = mem.get("fact")
+    if isinstance(fact, str):
+        mem["fact"] = intern(fact)
+    meta = mem.get("metadata")
+    if isinstance(meta, dict):
+        mem["metadata"] = {intern(k): v for k, v in meta.items()}
+    return {intern(k): v for k, v in mem.items()}
+
+
+def iter_hot_memories():
+    """Stream hot memories from the JSONL file one parsed entry at a time.
 
     Raises OSError if file exists but cannot be read (prevents silent data loss).
     Skips and logs corrupt JSON lines (partial write recovery).
     """
     if not os.path.isfile(HOT_MEMORY_PATH):
-        return []
+        return
     # Guard against corrupt/huge files (expect < 5MB for 200 memories)
     try:
         file_size = os.path.getsize(HOT_MEMORY_PATH)
         if file_size > 10 * 1024 * 1024:  # 10MB safety limit
             log_error(f"Hot memories file too large ({file_size / 1024 / 1024:.1f}MB), refusing to load")
-            return []
+            return
     except OSError:
         pass  # proceed anyway, open() will fail if unreadable
-    memories = []
     corrupt_lines = 0
     with open(HOT_MEMORY_PATH, "r") as f:
         for line in f:
             line = line.strip()
             if line:
                 try:
-                    memories.append(json.loads(line))
+                    mem = json.loads(line)
                 except json.JSONDecodeError:
                     corrupt_lines += 1
                     continue
+                yield _intern_memory(mem)
     if corrupt_lines > 0:
         log_warn(f"Skipped {corrupt_lines} corrupt lines in hot memories")
-    return memories
+
+
+def read_hot_memories() -> list:
+    """Read all hot memories from JSONL file (see iter_hot_memories)."""
+    return list(iter_hot_memories())
+
+
+def iter_valid_facts():
+    """Stream fact texts of hot memories that have not been invalidated."""
+    for mem in iter_hot_memories():
+        fact = mem.get("fact")
+        if fact and not mem.get("metadata", {}).get("t_invalid"):
+            yield fact
+
+
+def created_at_epoch(metadata: dict) -> float:
+    """Creation time of a memory as epoch seconds (0.0 if unknown).
+
+    Prefers the created_at_epoch field; falls back to parsing the ISO
+    created_at of entries written before that field existed.
+    """
+    epoch = metadata.get("created_at_epoch")
+    if isinstance(epoch, (int, float)):
+        return float(epoch)
+    created = metadata.get("created_at")
+    if created:
+        try:
+            dt = datetime.datetime.fromisoformat(created.replace("Z", "+00:00"))
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=datetime.timezone.utc)
+            return dt.timestamp()
+        except (ValueError, TypeError, AttributeError):
+            pass
+    return 0.0
+
+
+def iter_created_ats():
+    """Stream the creation times (epoch seconds) of all hot memories."""
+    for mem in iter_hot_memories():
+        yield created_at_epoch(mem.get("metadata", {}))
 
 
 def _archive_evicted(evicted: list):
@@ -228,6 +327,13 @@ def write_hot_memories(memories: list):
             unpinned = unpinned[-budget:]
         memories = pinned + unpinned
 
+    # Serialize everything first so the file is written in a single call
+    if HAS_ORJSON:
+        payload = b"".join(orjson.dumps(mem, option=orjson.OPT_APPEND_NEWLINE)
+                           for mem in memories)
+    else:
+        payload = "".join(json.dumps(mem) + "\n" for mem in memories).encode("utf-8")
+
     os.makedirs(os.path.dirname(HOT_MEMORY_PATH), exist_ok=True)
     try:
         fd, tmp_path = tempfile.mkstemp(
@@ -235,9 +341,8 @@ def write_hot_memories(memories: list):
             prefix=".hot-memories-", suffix=".tmp",
         )
         try:
-            with os.fdopen(fd, "w") as f:
-                for mem in memories:
-                    f.write(json.dumps(mem) + "\n")
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
             os.replace(tmp_path, HOT_MEMORY_PATH)
         except Exception:
             try:
@@ -267,6 +372,7 @@ def append_hot_memory(fact_text: str, metadata: dict):
                 return
         memories.append({"fact": fact_text, "metadata": metadata})
         write_hot_memories(memories)
+        _record_recent_add()
     finally:
         hot_memory_unlock(lock_fd)
 
@@ -302,10 +408,50 @@ def update_hot_memory(old_fact: str, new_fact: str, metadata: dict):
                 mem.setdefault("metadata", {})["t_invalid"] = now_iso
         memories.append({"fact": new_fact, "metadata": metadata})
         write_hot_memories(memories)
+        _record_recent_add()
     finally:
         hot_memory_unlock(lock_fd)
 
 
+# ---------------------------------------------------------------------------
+# Recent additions sidecar (rate limiting without scanning hot memories)
+# ---------------------------------------------------------------------------
+
+def _read_recent_adds():
+    """Return the recent-add epoch times within the window, or None if no sidecar."""
+    try:
+        adds = load_json_file(RECENT_ADDS_PATH).get("adds", [])
+    except (json.JSONDecodeError, OSError, AttributeError):
+        return None
+    cutoff = time.time() - RECENT_ADDS_WINDOW_SECONDS
+    return deque((ts for ts in adds if isinstance(ts, (int, float)) and ts > cutoff),
+                 maxlen=MAX_RECENT_ADDS)
+
+
+def _record_recent_add():
+    """Append now to the recent-adds sidecar (caller holds the hot-memory lock)."""
+    adds = _read_recent_adds()
+    if adds is None:
+        adds = deque(maxlen=MAX_RECENT_ADDS)
+    adds.append(time.time())
+    try:
+        atomic_write_json(RECENT_ADDS_PATH, {"adds": list(adds)})
+    except OSError as e:
+        log_warn(f"Could not update recent-adds sidecar: {e}")
+
+
+def count_recent_adds():
+    """Number of hot memory additions within the last hour, per the sidecar.
+
+    This counts add events, so a memory added and then deduped or pruned
+    within the hour still counts; the created_at scan only sees memories
+    still in the file. Returns None when the sidecar does not exist yet
+    (callers should fall back to scanning created_at timestamps).
+    """
+    adds = _read_recent_adds()
+    return None if adds is None else len(adds)
+
+
 # ---------------------------------------------------------------------------
 # Disk space guard
 # ---------------------------------------------------------------------------
@@ -508,14 +654,15 @@ def _write_failure_data(data: dict):
 def atomic_write_json(filepath: str, data):
     """Write JSON data to a file atomically."""
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    payload = json_dumps_indented(data)
     fd, tmp_path = tempfile.mkstemp(
         dir=os.path.dirname(filepath),
         prefix="." + os.path.basename(filepath) + "-",
         suffix=".tmp",
     )
     try:
-        with os.fdopen(fd, "w") as f:
-            json.dump(data, f, indent=2)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
         os.replace(tmp_path, filepath)
     except Exception:
         try:
@@ -638,7 +785,7 @@ def parse_claude_json(raw: str) -> dict:
         if lines and lines[-1].strip() == "```":
             lines = lines[:-1]
         cleaned = "\n".join(lines)
-    return json.loads(cleaned)
+    return json_loads(cleaned)
 
 
 # ---------------------------------------------------------------------------
@@ -691,22 +838,11 @@ def search_hot_memories_text(query: str, limit: int = 5) -> list:
     if not query or not query.strip():
         return []
 
-    memories = read_hot_memories()
-    if not memories:
-        return []
-
     query_lower = query.lower()
     query_words = set(query_lower.split())
 
     scored = []
-    for mem in memories:
-        fact = mem.get("fact", "")
-        if not fact:
-            continue
-        # Skip invalidated memories
-        if mem.get("metadata", {}).get("t_invalid"):
-            continue
-
+    for fact in iter_valid_facts():
         fact_lower = fact.lower()
 
         # Score: substring match = high, word overlap = proportional
@@ -17,6 +17,10 @@ from datetime import datetime, timezone
 import networkx as nx
 from networkx.readwrite import json_graph
 
+# Shared module (same directory)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import socket_daemon
+
 # Use AETHERVAULT_HOME env var, defaulting to ~/.aethervault
 AETHERVAULT_HOME = os.environ.get("AETHERVAULT_HOME", os.path.expanduser("~/.aethervault"))
 DEFAULT_GRAPH_FILE = os.path.join(AETHERVAULT_HOME, "data", "knowledge-graph.json")
@@ -24,6 +28,9 @@ DEFAULT_CONFIG_FILE = os.path.join(AETHERVAULT_HOME, "config", "knowledge-graph.
 
 LOCK_TIMEOUT = 30  # seconds to wait for file lock before giving up
 
+# Unix socket served by the daemon subcommand (queried by the morning briefing)
+KG_SOCK = os.path.join(AETHERVAULT_HOME, "run", "knowledge-graph.sock")
+
 
 def flock_with_timeout(fd, lock_type, timeout=LOCK_TIMEOUT):
     """Acquire flock with timeout. Raises TimeoutError if lock cannot be acquired."""
@@ -180,14 +187,44 @@ def add_relation(G, from_name, relation, to_name, confidence=1.0, source="manual
     if to_id is None:
         print(f"Warning: Entity '{to_name}' not found. Creating as 'topic' type.")
         to_id, _ = add_entity(G, "topic", to_name)
+    created = now_iso()
     G.add_edge(from_id, to_id,
                relation=relation,
                confidence=confidence,
                source=source,
-               created_at=now_iso())
+               created_at=created,
+               # Bi-temporal fields (valid time + transaction time)
+               t_valid=created,
+               t_invalid=None,
+               t_created=created,
+               t_expired=None)
     return from_id, to_id
 
 
+def apply_batch(G, batch):
+    """Apply a batch of entity and relation additions to G.
+
+    batch is {"entities": [{name, type, attrs?}, ...],
+              "relations": [{from, relation, to, confidence?, source?}, ...]}.
+    Entities are added first so relations resolve to their declared types.
+    Returns (entities_added, entities_updated, relations_added).
+    """
+    added = updated = 0
+    for ent in batch.get("entities", []):
+        _, is_new = add_entity(G, ent.get("type", "topic"), ent["name"], ent.get("attrs"))
+        if is_new:
+            added += 1
+        else:
+            updated += 1
+    relations = 0
+    for rel in batch.get("relations", []):
+        add_relation(G, rel["from"], rel["relation"], rel["to"],
+                     confidence=rel.get("confidence", 1.0),
+                     source=rel.get("source", "manual"))
+        relations += 1
+    return added, updated, relations
+
+
 def query_by_name(G, name_query):
     results = []
     query_lower = name_query.lower()
@@ -429,6 +466,87 @@ def format_entity(node_id, attrs):
     return "\n".join(parts)
 
 
+def format_query(G, name=None, entity_type=None, related_to=None):
+    """Render a query the way `query` prints it (shared by the CLI and daemon)."""
+    lines = []
+    if name:
+        results = query_by_name(G, name)
+        if not results:
+            return f"No entities matching '{name}'"
+        lines.append(f"Entities matching '{name}':")
+        for node_id, attrs in results:
+            lines.append(f"  {format_entity(node_id, attrs)}")
+    elif entity_type:
+        results = query_by_type(G, entity_type)
+        if not results:
+            return f"No entities of type '{entity_type}'"
+        lines.append(f"Entities of type '{entity_type}':")
+        for node_id, attrs in results:
+            lines.append(f"  {format_entity(node_id, attrs)}")
+    elif related_to:
+        results = query_related_to(G, related_to)
+        if not results:
+            return f"No relations found for '{related_to}'"
+        lines.append(f"Relations for '{related_to}':")
+        for r in results:
+            if r["direction"] == "outgoing":
+                lines.append(f"  -> {r['relation']} -> {r['entity']} ({r['entity_type']})")
+            else:
+                lines.append(f"  <- {r['relation']} <- {r['entity']} ({r['entity_type']})")
+    else:
+        return "Specify --name, --type, or --related-to"
+    return "\n".join(lines)
+
+
+# --- Daemon ---
+
+_graph_cache = {"key": None, "graph": None}
+
+
+def _cached_load_graph():
+    """load_graph(), reused while the graph file's mtime and size are unchanged."""
+    graph_file = get_graph_file()
+    try:
+        st = os.stat(graph_file)
+        key = (graph_file, st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = (graph_file, None, None)
+    if _graph_cache["key"] != key:
+        _graph_cache.update(key=key, graph=load_graph(graph_file))
+    return _graph_cache["graph"]
+
+
+def _handle_request(request):
+    """Dispatch one daemon request and return its JSON-serializable result."""
+    if not isinstance(request, dict):
+        raise ValueError("request must be a JSON object")
+    cmd = request.get("cmd")
+    if cmd == "query":
+        return format_query(_cached_load_graph(), name=request.get("name"),
+                            entity_type=request.get("type"),
+                            related_to=request.get("related_to"))
+    if cmd == "summary":
+        topic = request.get("topic")
+        if not isinstance(topic, str):
+            raise ValueError("summary needs a topic string")
+        return get_summary(_cached_load_graph(), topic)
+    raise ValueError(f"unknown cmd {cmd!r}")
+
+
+def cmd_daemon(args):
+    """Serve read-only query/summary requests on a Unix socket.
+
+    Keeps the interpreter, networkx and the parsed graph loaded between
+    requests; the graph is reloaded whenever the file changes on disk.
+    Each connection sends one JSON line such as {"cmd": "query", "type":
+    "project"} and receives {"ok": true, "result": "<query output>"} (or
+    {"ok": false, "error": "..."}). Writes still go through the CLI.
+    """
+    _cached_load_graph()
+    socket_daemon.serve_forever(args.socket, _handle_request, "Knowledge graph",
+                                max_request_bytes=1 << 16)
+
+
 # --- CLI ---
 
 def cmd_add_entity(args):
@@ -450,37 +568,21 @@ def cmd_add_relation(args):
     print(f"Added relation: {args.from_entity} --[{args.relation}]--> {args.to_entity}")
 
 
+def cmd_batch(args):
+    try:
+        batch = json.load(sys.stdin)
+    except json.JSONDecodeError as e:
+        print(f"Error: invalid batch JSON on stdin: {e}", file=sys.stderr)
+        sys.exit(1)
+    with graph_transaction() as G:
+        added, updated, relations = apply_batch(G, batch)
+    print(f"Batch applied: {added} entities added, {updated} updated, "
+          f"{relations} relations added")
+
+
 def cmd_query(args):
     G = load_graph()
-    if args.name:
-        results = query_by_name(G, args.name)
-        if not results:
-            print(f"No entities matching '{args.name}'")
-            return
-        print(f"Entities matching '{args.name}':")
-        for node_id, attrs in results:
-            print(f"  {format_entity(node_id, attrs)}")
-    elif args.type:
-        results = query_by_type(G, args.type)
-        if not results:
-            print(f"No entities of type '{args.type}'")
-            return
-        print(f"Entities of type '{args.type}':")
-        for node_id, attrs in results:
-            print(f"  {format_entity(node_id, attrs)}")
-    elif args.related_to:
-        results = query_related_to(G, args.related_to)
-        if not results:
-            print(f"No relations found for '{args.related_to}'")
-            return
-        print(f"Relations for '{args.related_to}':")
-        for r in results:
-            if r["direction"] == "outgoing":
-                print(f"  -> {r['relation']} -> {r['entity']} ({r['entity_type']})")
-            else:
-                print(f"  <- {r['relation']} <- {r['entity']} ({r['entity_type']})")
-    else:
-        print("Specify --name, --type, or --related-to")
+    print(format_query(G, name=args.name, entity_type=args.type, related_to=args.related_to))
 
 
 def cmd_ingest(args):
@@ -547,6 +649,11 @@ def main():
     p_rel.add_argument("--confidence", type=float, default=1.0, help="Confidence score (0-1)")
     p_rel.set_defaults(func=cmd_add_relation)
 
+    # batch
+    p_batch = subparsers.add_parser(
+        "batch", help="Apply entities/relations from a JSON object on stdin in one transaction")
+    p_batch.set_defaults(func=cmd_batch)
+
     # query
     p_query = subparsers.add_parser("query", help="Query the knowledge graph")
     p_query.add_argument("--name", default=None, help="Search by name (partial match)")
@@ -572,6 +679,13 @@ def main():
     p_export = subparsers.add_parser("export", help="Export full graph as JSON")
     p_export.set_defaults(func=cmd_export)
 
+    # daemon
+    p_daemon = subparsers.add_parser(
+        "daemon", help="Serve read-only queries on a Unix socket")
+    p_daemon.add_argument("--socket", default=KG_SOCK,
+                          help=f"Socket path (default: {KG_SOCK})")
+    p_daemon.set_defaults(func=cmd_daemon)
+
     args = parser.parse_args()
     if args.command is None:
         parser.print_help()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+AetherVault LLM Response Cache — Shared Module
+==============================================
+
+Content-addressed, on-disk cache for Claude responses. Keys are the SHA-256
+of the full request (system prompt, user message, model, max_tokens), so an
+identical prompt issued by a later cron run is answered from disk instead of
+the API.
+
+Entries live as one JSON file per key under data/llm_cache/ and carry their
+own expiry. Expired or corrupt entries are treated as misses and removed,
+and the first put() in each process sweeps out files older than
+MAX_TTL_SECONDS, since most keys are never requested again.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from hot_memory_store import AETHERVAULT_HOME, atomic_write_json, load_json_file, log_warn
+
+CACHE_DIR = os.path.join(AETHERVAULT_HOME, "data", "llm_cache")
+MAX_TTL_SECONDS = 86400  # longest TTL put() stores; older files are swept
+
+_swept = False
+
+
+def make_key(*parts) -> str:
+    """Hash the request parts (strings or JSON-serializable values) into a cache key."""
+    h = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, str):
+            part = json.dumps(part, sort_keys=True)
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def get(key: str):
+    """Return the cached response for key, or None on miss/expiry."""
+    path = _entry_path(key)
+    try:
+        entry = load_json_file(path)
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, OSError):
+        entry = None
+    if not isinstance(entry, dict) or entry.get("expires_at", 0) < time.time():
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        return None
+    return entry.get("response")
+
+
+def _sweep_expired():
+    """Remove entry files old enough that they have expired under any TTL."""
+    cutoff = time.time() - MAX_TTL_SECONDS
+    try:
+        entries = list(os.scandir(CACHE_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def put(key: str, response: str, ttl_s: float):
+    """Store a response under key for ttl_s seconds, capped at MAX_TTL_SECONDS
+    (failures are non-fatal)."""
+    global _swept
+    if not _swept:
+        _swept = True
+        _sweep_expired()
+    try:
+        atomic_write_json(_entry_path(key), {
+            "expires_at": time.time() + min(ttl_s, MAX_TTL_SECONDS),
+            "response": response,
+        })
+    except OSError as e:
+        log_warn(f"Could not write LLM cache entry: {e}")
@@ -8,16 +8,30 @@ Usage:
     python3 mcp-gateway.py list-servers          List registered MCP servers
     python3 mcp-gateway.py list-tools             List all tools across all servers
     python3 mcp-gateway.py call <server> <tool> '<args-json>'   Invoke a tool
+    python3 mcp-gateway.py call <server> <tool> '<args-json>' --fast
+                                                  Invoke via raw stdio JSON-RPC
 """
 
 import asyncio
+import functools
+import io
 import json
+import subprocess
 import sys
+import threading
+from collections import deque
 from pathlib import Path
 
 from mcp import ClientSession
 from mcp.client.stdio import stdio_client, StdioServerParameters
 
+# uvloop is optional; it speeds up the many small pipe reads/writes of stdio MCP
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 CONFIG_PATH = Path("/root/.aethervault/config/mcp-servers.json")
 
 # Timeouts for MCP server operations (seconds)
@@ -25,6 +39,9 @@ MCP_INIT_TIMEOUT = 15       # Time to wait for server initialization
 MCP_TOOL_CALL_TIMEOUT = 60  # Time to wait for a tool call response
 MCP_LIST_TIMEOUT = 10       # Time to wait for listing tools
 
+# Protocol version advertised by the --fast raw JSON-RPC call path
+MCP_PROTOCOL_VERSION = "2024-11-05"
+
 
 def load_config() -> dict:
     """Load the MCP server registry."""
@@ -32,7 +49,11 @@ def load_config() -> dict:
         print(f"Error: Config not found at {CONFIG_PATH}", file=sys.stderr)
         sys.exit(1)
     with open(CONFIG_PATH) as f:
-        return json.load(f)
+        config = json.load(f)
+    config["_enabled_set"] = frozenset(
+        name for name, info in config.get("servers", {}).items() if info.get("enabled", False)
+    )
+    return config
 
 
 def list_servers():
@@ -43,25 +64,29 @@ def list_servers():
         print("No servers registered.")
         return
 
-    print(f"Registered MCP servers ({len(servers)}):\n")
+    parts = [f"Registered MCP servers ({len(servers)}):\n\n"]
     for name, info in servers.items():
         enabled = info.get("enabled", False)
         status = "ENABLED" if enabled else "DISABLED"
         desc = info.get("description", "No description")
         note = info.get("note", "")
-        print(f"  [{status}] {name}")
-        print(f"    Description: {desc}")
+        parts.append(f"  [{status}] {name}\n")
+        parts.append(f"    Description: {desc}\n")
         if note:
-            print(f"    Note: {note}")
-        print()
+            parts.append(f"    Note: {note}\n")
+        parts.append("\n")
+    sys.stdout.write("".join(parts))
+
+
+@functools.lru_cache(maxsize=None)
+def _server_params(command: str, args: tuple[str, ...]) -> StdioServerParameters:
+    """Build (and cache) the pydantic launch parameters for a server."""
+    return StdioServerParameters(command=command, args=list(args))
 
 
 async def _connect_and_list_tools(name: str, info: dict) -> list[dict]:
     """Connect to a server and list its tools (with timeouts)."""
-    server_params = StdioServerParameters(
-        command=info["command"],
-        args=info.get("args", []),
-    )
+    server_params = _server_params(info["command"], tuple(info.get("args", [])))
     tools = []
     async with stdio_client(server_params) as (read, write):
         async with ClientSession(read, write) as session:
@@ -80,7 +105,7 @@ async def list_tools_async():
     """List all tools from all enabled servers."""
     config = load_config()
     servers = config.get("servers", {})
-    enabled = {k: v for k, v in servers.items() if v.get("enabled", False)}
+    enabled = {k: v for k, v in servers.items() if k in config["_enabled_set"]}
 
     if not enabled:
         print("No enabled servers.")
@@ -98,41 +123,74 @@ async def list_tools_async():
         print("No tools available.")
         return
 
-    print(f"Available MCP tools ({len(all_tools)}):\n")
+    parts = [f"Available MCP tools ({len(all_tools)}):\n\n"]
     current_server = None
     for tool in all_tools:
         if tool["server"] != current_server:
             current_server = tool["server"]
-            print(f"  [{current_server}]")
-        print(f"    {tool['name']}: {tool['description']}")
-    print()
-
-
-async def call_tool_async(server_name: str, tool_name: str, args_json: str):
-    """Call a specific tool on a specific server."""
+            parts.append(f"  [{current_server}]\n")
+        parts.append(f"    {tool['name']}: {tool['description']}\n")
+    parts.append("\n")
+    sys.stdout.write("".join(parts))
+
+
+def _leaf_exceptions(eg: BaseExceptionGroup | None) -> list[BaseException]:
+    """Flatten an exception group of any depth into its leaf exceptions."""
+    leaves = []
+    pending = deque([eg] if eg is not None else [])
+    while pending:
+        exc = pending.popleft()
+        if isinstance(exc, BaseExceptionGroup):
+            pending.extend(exc.exceptions)
+        else:
+            leaves.append(exc)
+    return leaves
+
+
+def _resolve_server(server_name: str) -> dict:
+    """Look up an enabled server's registry entry, exiting if unavailable."""
     config = load_config()
     servers = config.get("servers", {})
 
-    if server_name not in servers:
-        print(f"Error: Server '{server_name}' not found. Available: {', '.join(servers.keys())}", file=sys.stderr)
+    if server_name not in config["_enabled_set"]:
+        if server_name in servers:
+            print(f"Error: Server '{server_name}' is disabled.", file=sys.stderr)
+        else:
+            print(f"Error: Server '{server_name}' not found. Available: {', '.join(servers.keys())}", file=sys.stderr)
         sys.exit(1)
 
-    info = servers[server_name]
-    if not info.get("enabled", False):
-        print(f"Error: Server '{server_name}' is disabled.", file=sys.stderr)
-        sys.exit(1)
+    return servers[server_name]
 
-    # Parse args
+
+def _parse_args(args_json: str) -> dict:
+    """Parse the tool arguments JSON, exiting on invalid input."""
+    stripped = args_json.strip()
+    if stripped in ("", "{}"):
+        return {}  # the CLI default; skip the JSON parser entirely
     try:
-        args = json.loads(args_json) if args_json else {}
+        return json.loads(stripped)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON arguments: {e}", file=sys.stderr)
         sys.exit(1)
 
-    server_params = StdioServerParameters(
-        command=info["command"],
-        args=info.get("args", []),
-    )
+
+def _write_texts(texts) -> None:
+    """Write content blocks to stdout, one per line, in a single write."""
+    out = io.BytesIO()
+    for text in texts:
+        out.write(text.encode())
+        out.write(b"\n")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(out.getvalue())
+    sys.stdout.buffer.flush()
+
+
+async def call_tool_async(server_name: str, tool_name: str, args_json: str):
+    """Call a specific tool on a specific server."""
+    info = _resolve_server(server_name)
+    args = _parse_args(args_json)
+
+    server_params = _server_params(info["command"], tuple(info.get("args", [])))
 
     exit_code = 0
     try:
@@ -144,24 +202,19 @@ async def call_tool_async(server_name: str, tool_name: str, args_json: str):
                     timeout=MCP_TOOL_CALL_TIMEOUT,
                 )
 
-                # Format output
-                for content in result.content:
-                    if hasattr(content, "text"):
-                        print(content.text)
-                    else:
-                        print(str(content))
+                # Format output (one write for all content blocks)
+                _write_texts(
+                    content.text if hasattr(content, "text") else str(content)
+                    for content in result.content
+                )
 
                 if result.isError:
                     exit_code = 1
     except BaseExceptionGroup as eg:
-        # Extract the actual error message from exception groups
-        for exc in eg.exceptions:
-            if isinstance(exc, BaseExceptionGroup):
-                for inner in exc.exceptions:
-                    if not isinstance(inner, SystemExit):
-                        print(f"Error: {inner}", file=sys.stderr)
-            elif not isinstance(exc, SystemExit):
-                print(f"Error: {exc}", file=sys.stderr)
+        # Extract the actual error messages from (arbitrarily nested) exception groups
+        _, errors = eg.split(SystemExit)
+        for exc in _leaf_exceptions(errors):
+            print(f"Error: {exc}", file=sys.stderr)
         exit_code = 1
     except Exception as e:
         print(f"Error calling {server_name}.{tool_name}: {e}", file=sys.stderr)
@@ -171,6 +224,93 @@ async def call_tool_async(server_name: str, tool_name: str, args_json: str):
         sys.exit(exit_code)
 
 
+def _read_response(proc: subprocess.Popen, request_id: int) -> dict:
+    """Read newline-delimited JSON-RPC messages until the reply to request_id."""
+    for line in proc.stdout:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # stray non-protocol output
+        if message.get("id") == request_id:
+            return message
+    raise RuntimeError("server closed stdout before responding")
+
+
+def call_tool_fast(server_name: str, tool_name: str, args_json: str):
+    """Call a tool by speaking stdio JSON-RPC directly, without the MCP client stack.
+
+    Skips the anyio task group and pydantic validation of every message, which
+    dominate the cost of a one-shot call. Text blocks are printed as-is and any
+    other content block as its raw JSON, like call_tool_async's str() fallback.
+    """
+    info = _resolve_server(server_name)
+    args = _parse_args(args_json)
+
+    messages = [
+        {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {
+            "protocolVersion": MCP_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "aethervault-mcp-gateway", "version": "1.0"},
+        }},
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {
+            "name": tool_name,
+            "arguments": args,
+        }},
+    ]
+    frames = [json.dumps(m).encode() + b"\n" for m in messages]
+
+    proc = subprocess.Popen(
+        [info["command"], *info.get("args", [])],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    # Hard deadline for the whole exchange; killing the server unblocks the reads
+    watchdog = threading.Timer(MCP_INIT_TIMEOUT + MCP_TOOL_CALL_TIMEOUT, proc.kill)
+    watchdog.start()
+
+    exit_code = 0
+    try:
+        proc.stdin.write(frames[0])
+        proc.stdin.flush()
+        reply = _read_response(proc, 1)
+        if "error" in reply:
+            raise RuntimeError(reply["error"].get("message", reply["error"]))
+
+        proc.stdin.write(frames[1] + frames[2])
+        proc.stdin.flush()
+        reply = _read_response(proc, 2)
+        if "error" in reply:
+            raise RuntimeError(reply["error"].get("message", reply["error"]))
+
+        result = reply.get("result", {})
+        _write_texts(
+            block["text"] if "text" in block else json.dumps(block)
+            for block in result.get("content", [])
+        )
+        if result.get("isError"):
+            exit_code = 1
+    except Exception as e:
+        if not watchdog.is_alive():
+            e = f"timed out after {MCP_INIT_TIMEOUT + MCP_TOOL_CALL_TIMEOUT}s"
+        print(f"Error calling {server_name}.{tool_name}: {e}", file=sys.stderr)
+        exit_code = 1
+    finally:
+        watchdog.cancel()
+        proc.stdin.close()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    if exit_code:
+        sys.exit(exit_code)
+
+
 def usage():
     print("MCP Gateway - AetherVault Tool Interface")
     print()
@@ -178,6 +318,7 @@ def usage():
     print("  python3 mcp-gateway.py list-servers                    List registered servers")
     print("  python3 mcp-gateway.py list-tools                      List all available tools")
     print("  python3 mcp-gateway.py call <server> <tool> '<json>'   Call a tool")
+    print("      --fast   Bypass the MCP client stack (raw stdio JSON-RPC; non-text blocks print as JSON)")
     print()
     print("Examples:")
     print('  python3 mcp-gateway.py call filesystem read_file \'{"path": "/root/.aethervault/workspace/SOUL.md"}\'')
@@ -193,18 +334,26 @@ def main():
 
     command = sys.argv[1]
 
+    if HAS_UVLOOP:
+        uvloop.install()
+
     if command == "list-servers":
         list_servers()
     elif command == "list-tools":
         asyncio.run(list_tools_async())
     elif command == "call":
-        if len(sys.argv) < 4:
-            print("Error: 'call' requires: <server> <tool> [args-json]", file=sys.stderr)
+        argv = [a for a in sys.argv if a != "--fast"]
+        fast = len(argv) != len(sys.argv)
+        if len(argv) < 4:
+            print("Error: 'call' requires: <server> <tool> [args-json] [--fast]", file=sys.stderr)
             sys.exit(1)
-        server = sys.argv[2]
-        tool = sys.argv[3]
-        args_json = sys.argv[4] if len(sys.argv) > 4 else "{}"
-        asyncio.run(call_tool_async(server, tool, args_json))
+        server = argv[2]
+        tool = argv[3]
+        args_json = argv[4] if len(argv) > 4 else "{}"
+        if fast:
+            call_tool_fast(server, tool, args_json)
+        else:
+            asyncio.run(call_tool_async(server, tool, args_json))
     elif command in ("help", "--help", "-h"):
         usage()
     else:
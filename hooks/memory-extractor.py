@@ -19,31 +19,42 @@ Usage:
     python3 memory-extractor.py --dry-run    # print without writing
     python3 memory-extractor.py --window 15  # look back 15 minutes
     python3 memory-extractor.py --force      # ignore last-processed marker
+    python3 memory-extractor.py --no-cache   # bypass the on-disk reconciliation cache
 """
 
 import argparse
+import contextlib
 import datetime
 import fcntl
+import hashlib
+import importlib.util
+import io
 import json
 import os
+import re
 import subprocess
 import sys
 import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # Shared module (same directory)
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from hot_memory_store import (
-    AETHERVAULT_HOME, CAPSULE_PATH, AETHERVAULT_BIN, OWNER_NAME,
+    AETHERVAULT_HOME, CAPSULE_PATH, AETHERVAULT_BIN, OWNER_NAME, HOT_MEMORY_PATH,
     PROMOTE_THRESHOLD,
     log, log_error, log_warn,
     load_env, get_api_key, call_claude, parse_claude_json, send_telegram,
     read_hot_memories, write_hot_memories, append_hot_memory,
+    iter_valid_facts, iter_created_ats, created_at_epoch, count_recent_adds,
     invalidate_hot_memory, update_hot_memory,
     check_disk_space, cleanup_temp_files, rotate_archive, prune_invalidated,
-    record_failure, record_success, atomic_write_json,
+    record_failure, record_success, atomic_write_json, load_json_file,
     search_capsule, search_hot_memories_text,
     hot_memory_lock, hot_memory_unlock,
 )
+import llm_cache
 
 # ---------------------------------------------------------------------------
 # Extractor-specific configuration
@@ -51,17 +62,42 @@ from hot_memory_store import (
 
 KNOWLEDGE_GRAPH_PATH = os.path.join(AETHERVAULT_HOME, "data", "knowledge-graph.json")
 KNOWLEDGE_GRAPH_HOOK = os.path.join(AETHERVAULT_HOME, "hooks", "knowledge-graph.py")
+KNOWLEDGE_GRAPH_META_PATH = os.path.join(AETHERVAULT_HOME, "data", "knowledge-graph.meta.json")
+BITEMPORAL_VERSION = 1
 MARKER_PATH = os.path.join(AETHERVAULT_HOME, "data", "extractor-marker.json")
 PID_FILE = os.path.join(AETHERVAULT_HOME, "data", "extractor.pid")
+# Agent JSONL logs written by the runtime (<workspace>/logs/agent-YYYY-MM-DD.jsonl)
+AGENT_LOG_DIR = os.path.join(
+    os.environ.get("AETHERVAULT_WORKSPACE")
+    or os.path.expanduser("~/aethervault-workspace/assistant"),
+    "logs",
+)
+LOG_POSITION_PATH = os.path.join(AETHERVAULT_HOME, "data", "log_line_count.json")
+# Adaptive wake: run once this many log lines arrive, or after MAX_IDLE_MINUTES
+MIN_NEW_LOG_LINES = 20
+MAX_IDLE_MINUTES = 15
 
 DEFAULT_WINDOW_MINUTES = 10
 HOT_PATH_IMPORTANCE_THRESHOLD = 5
 MAX_LOG_CHARS = 30000
 MAX_ADDITIONS_PER_HOUR = 5
 MIN_FACT_LENGTH = 20
+# Short windows scoring below this (sentences + 0.5 * capitalized words) and
+# without a first-person statement skip extraction
+LOW_SIGNAL_MIN_SCORE = 2
+LOW_SIGNAL_MAX_CHARS = 500
+FACT_VOCAB_SIZE = 4096  # token bits used for the duplicate-check bitmasks
+DUPLICATE_OVERLAP_RATIO = 0.6
+SEARCH_WORKERS = 8  # concurrent existing-memory lookups during reconciliation
+
+# On-disk LLM response cache for reconciliation (disable with --no-cache)
+RECONCILE_CACHE_TTL_SECONDS = 86400  # reconciliation is deterministic for a given input
+USE_LLM_CACHE = True
 
 COMPONENT_NAME = "memory-extractor"
 DAILY_DIGEST_PATH = os.path.join(AETHERVAULT_HOME, "data", "extractor-daily-digest.json")
+# Rendered "already known facts" block, keyed on the hot memory file's mtime/size
+FACT_SUMMARY_CACHE_PATH = os.path.join(AETHERVAULT_HOME, "data", "existing-facts-summary.json")
 
 
 # ---------------------------------------------------------------------------
@@ -87,27 +123,87 @@ def acquire_instance_lock():
 # Marker tracking
 # ---------------------------------------------------------------------------
 
-def read_marker() -> str:
+def read_marker_data() -> dict:
     if os.path.isfile(MARKER_PATH):
         try:
-            with open(MARKER_PATH, "r") as f:
-                data = json.load(f)
-                return data.get("last_processed", "")
+            data = load_json_file(MARKER_PATH)
+            if isinstance(data, dict):
+                return data
         except (json.JSONDecodeError, OSError) as e:
             log_warn(f"Marker file corrupted or unreadable: {e}")
-    return ""
+    return {}
+
+
+def read_marker() -> str:
+    return read_marker_data().get("last_processed", "")
 
 
-def write_marker(timestamp: str):
+def write_marker(timestamp: str, logs_sha256: str = ""):
+    """Advance the marker; logs_sha256 records which log window was processed."""
+    data = {
+        "last_processed": timestamp,
+        "updated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+    if logs_sha256:
+        data["last_logs_sha256"] = logs_sha256
     try:
-        atomic_write_json(MARKER_PATH, {
-            "last_processed": timestamp,
-            "updated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-        })
+        atomic_write_json(MARKER_PATH, data)
     except OSError as e:
         log_warn(f"Could not write marker: {e}")
 
 
+# ---------------------------------------------------------------------------
+# Adaptive wake (skip idle cron ticks)
+# ---------------------------------------------------------------------------
+
+def _agent_log_file() -> str:
+    date_str = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d")
+    return os.path.join(AGENT_LOG_DIR, f"agent-{date_str}.jsonl")
+
+
+def count_new_log_lines():
+    """Count agent log lines appended since the last extraction run.
+
+    Only the bytes past the offset recorded in LOG_POSITION_PATH are read.
+    Returns (new_lines, position) where position is the state to save once
+    this run proceeds, or (None, None) when the agent log is not available.
+    """
+    path = _agent_log_file()
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return None, None
+    try:
+        state = load_json_file(LOG_POSITION_PATH)
+    except (json.JSONDecodeError, OSError):
+        state = {}
+    offset = 0
+    if isinstance(state, dict) and state.get("path") == path:
+        offset = int(state.get("offset", 0))
+    if offset > size:  # truncated or replaced
+        offset = 0
+    new_lines = 0
+    if size > offset:
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                while True:
+                    chunk = f.read(1 << 16)
+                    if not chunk:
+                        break
+                    new_lines += chunk.count(b"\n")
+        except OSError:
+            return None, None
+    return new_lines, {"path": path, "offset": size}
+
+
+def save_log_position(position: dict):
+    try:
+        atomic_write_json(LOG_POSITION_PATH, position)
+    except OSError as e:
+        log_warn(f"Could not write log position: {e}")
+
+
 # ---------------------------------------------------------------------------
 # Capsule query
 # ---------------------------------------------------------------------------
@@ -175,6 +271,46 @@ def query_recent_logs(window_minutes: int):
     return None
 
 
+# ---------------------------------------------------------------------------
+# Cached Claude calls
+# ---------------------------------------------------------------------------
+
+def _parse_valid(raw: str, validate):
+    """Parse raw as Claude JSON; None if it does not parse or validate(data) is false."""
+    try:
+        data = parse_claude_json(raw)
+    except (json.JSONDecodeError, ValueError):
+        return None
+    return data if validate(data) else None
+
+
+def call_claude_json(api_key: str, system: str, user_msg: str, max_tokens: int,
+                     ttl_seconds: float, validate) -> tuple:
+    """Call Claude and parse its JSON reply, going through the on-disk cache.
+
+    Returns (raw, data): raw is "" on API failure, data is None when raw
+    could not be parsed or validate(data) rejects its shape. Only responses
+    that pass validate are cached, so a malformed reply is not replayed.
+    """
+    model = os.environ.get("EXTRACTOR_MODEL", os.environ.get("REFLECTION_MODEL", ""))
+    key = llm_cache.make_key(system, user_msg, model, max_tokens)
+    if USE_LLM_CACHE:
+        raw = llm_cache.get(key)
+        if raw is not None:
+            data = _parse_valid(raw, validate)
+            if data is not None:
+                log("LLM cache hit, skipping Claude call")
+                return raw, data
+
+    raw = call_claude(api_key, system, user_msg, max_tokens=max_tokens)
+    if not raw:
+        return "", None
+    data = _parse_valid(raw, validate)
+    if data is not None and USE_LLM_CACHE:
+        llm_cache.put(key, raw, ttl_seconds)
+    return raw, data
+
+
 # ---------------------------------------------------------------------------
 # Fact extraction (Phase 1)
 # ---------------------------------------------------------------------------
@@ -215,7 +351,8 @@ Rules:
 """
 
 
-def extract_facts(api_key: str, logs: str, marker_timestamp: str = ""):
+def extract_facts(api_key: str, logs: str, marker_timestamp: str = "",
+                  memories: list = None):
     """Returns list on success (may be empty), None on API/parse failure."""
     context_lines = []
     if marker_timestamp:
@@ -224,7 +361,7 @@ def extract_facts(api_key: str, logs: str, marker_timestamp: str = ""):
             f"Ignore older context that was already processed."
         )
     # Include existing hot memory facts so Claude avoids re-extracting them
-    existing_facts = _get_existing_fact_summaries()
+    existing_facts = _get_existing_fact_summaries(memories=memories)
     if existing_facts:
         context_lines.append(
             f"ALREADY KNOWN FACTS (do NOT re-extract these):\n{existing_facts}"
@@ -236,6 +373,8 @@ def extract_facts(api_key: str, logs: str, marker_timestamp: str = ""):
         f"--- BEGIN LOGS ---\n{logs}\n--- END LOGS ---"
     )
 
+    # Not cached: the prompt carries the per-run marker timestamp, and an
+    # unchanged log window is already skipped by its logs_sha256
     raw = call_claude(api_key, EXTRACT_SYSTEM, user_msg, max_tokens=2048)
     if not raw:
         log_error("Claude API returned empty response for extraction")
@@ -255,81 +394,229 @@ def extract_facts(api_key: str, logs: str, marker_timestamp: str = ""):
         return None
 
 
-def _get_existing_fact_summaries(max_chars: int = 1000) -> str:
-    """Return a compact summary of existing hot memory facts for the extraction prompt."""
-    memories = read_hot_memories()
-    if not memories:
-        return ""
+def _get_existing_fact_summaries(max_chars: int = 1000, memories: list = None) -> str:
+    """Return a compact summary of existing hot memory facts for the extraction prompt.
+
+    The rendered summary is cached on disk and reused until the hot memory
+    file changes, so unchanged cron ticks skip the rebuild.
+    """
+    try:
+        st = os.stat(HOT_MEMORY_PATH)
+        cache_key = [st.st_mtime_ns, st.st_size, max_chars]
+    except OSError:
+        cache_key = None
+    if cache_key is not None:
+        try:
+            cached = load_json_file(FACT_SUMMARY_CACHE_PATH)
+            if isinstance(cached, dict) and cached.get("key") == cache_key:
+                return cached.get("summary", "")
+        except (json.JSONDecodeError, OSError):
+            pass
+
+    if memories is None:
+        valid_facts = iter_valid_facts()
+    else:
+        valid_facts = (m.get("fact", "") for m in memories
+                       if not m.get("metadata", {}).get("t_invalid"))
     facts = []
     total = 0
-    for mem in memories:
-        if mem.get("metadata", {}).get("t_invalid"):
-            continue
-        fact = mem.get("fact", "").strip()
+    for fact in valid_facts:
+        fact = fact.strip()
         if fact and total + len(fact) < max_chars:
             facts.append(f"- {fact}")
             total += len(fact) + 3
-    return "\n".join(facts)
+    summary = "\n".join(facts)
+
+    if cache_key is not None:
+        try:
+            atomic_write_json(FACT_SUMMARY_CACHE_PATH, {"key": cache_key, "summary": summary})
+        except OSError as e:
+            log_warn(f"Could not write fact summary cache: {e}")
+    return summary
+
+
+_SENTENCE_END_RE = re.compile(r"[.!?]\s")
+_PROPER_NOUN_RE = re.compile(r"\b[A-Z][a-z]+\b")
+_FIRST_PERSON_RE = re.compile(r"\b(?:I|[Mm]y|[Mm]e|[Mm]ine|[Ww]e|[Oo]ur)\b")
+
+
+def is_low_signal(logs: str) -> bool:
+    """Cheap pre-filter for log windows with essentially nothing to extract.
+
+    Only short windows with almost no sentences or names and no first-person
+    statement are skipped; a single short fact ("my wife is allergic to
+    peanuts") must still reach Claude, since the marker moves past skipped
+    windows for good.
+    """
+    if len(logs) >= LOW_SIGNAL_MAX_CHARS:
+        return False
+    signal = (len(_SENTENCE_END_RE.findall(logs))
+              + 0.5 * len(_PROPER_NOUN_RE.findall(logs)))
+    return signal < LOW_SIGNAL_MIN_SCORE and not _FIRST_PERSON_RE.search(logs)
 
 
 # ---------------------------------------------------------------------------
 # Validation (Phase 2.5 — self-review before commit)
 # ---------------------------------------------------------------------------
 
-def validate_candidate(candidate: dict, existing_hot_facts: list) -> tuple:
-    """Pre-commit quality gate. Returns (keep: bool, reason: str).
+_CAPITALIZED_WORD_RE = re.compile(r"\b[A-Z][A-Za-z0-9_-]+\b")
+_ENTITY_STOP_WORDS = frozenset({"The", "This", "That", "User"})
+
+
+def build_fact_index(facts: list) -> tuple:
+    """Tokenize existing facts once for duplicate checks.
+
+    Each fact becomes an int bitmask over a vocabulary of the (at most
+    FACT_VOCAB_SIZE) most common tokens, so word overlap is a single
+    (a & b).bit_count(). Returns (facts, token_sets, masks, complete, vocab);
+    complete[i] is False when fact i has tokens outside the vocabulary.
+    """
+    token_sets = [frozenset(f.lower().split()) for f in facts]
+    counts = Counter(token for tokens in token_sets for token in tokens)
+    vocab = {token: bit for bit, (token, _) in
+             enumerate(counts.most_common(FACT_VOCAB_SIZE))}
+    masks = []
+    complete = []
+    for tokens in token_sets:
+        mask = 0
+        in_vocab = True
+        for token in tokens:
+            bit = vocab.get(token)
+            if bit is None:
+                in_vocab = False
+            else:
+                mask |= 1 << bit
+        masks.append(mask)
+        complete.append(in_vocab)
+    return facts, token_sets, masks, complete, vocab
+
+
+def _first_duplicates(cand_masks, cand_sizes, exist_masks, exist_sizes, ratio) -> list:
+    """Index of the first existing mask each candidate mask overlaps by more
+    than ratio of the smaller fact, or -1.
+
+    Sizes are the full token counts of each fact (they may exceed the mask's
+    popcount when a fact has tokens outside the bit vocabulary).
+    """
+    result = []
+    for c_mask, c_size in zip(cand_masks, cand_sizes):
+        found = -1
+        for j, (e_mask, e_size) in enumerate(zip(exist_masks, exist_sizes)):
+            overlap = (c_mask & e_mask).bit_count()
+            if overlap and overlap / min(c_size, e_size) > ratio:
+                found = j
+                break
+        result.append(found)
+    return result
+
+
+def find_duplicates(fact_texts: list, fact_index: tuple) -> list:
+    """For each text, the index of the first existing fact with word overlap
+    > DUPLICATE_OVERLAP_RATIO of the smaller token set, or -1.
+
+    In-vocabulary overlap is a popcount of the token bitmasks; candidate
+    tokens outside the vocabulary can only match facts that also have
+    out-of-vocab tokens, which are then checked with plain set intersection.
+    """
+    existing_facts, token_sets, masks, complete, vocab = fact_index
+    word_sets = [set(t.lower().split()) for t in fact_texts]
+    cand_masks = []
+    oov_sets = []
+    for words in word_sets:
+        mask = 0
+        oov = set()
+        for word in words:
+            bit = vocab.get(word)
+            if bit is None:
+                oov.add(word)
+            else:
+                mask |= 1 << bit
+        cand_masks.append(mask)
+        oov_sets.append(oov)
+
+    # In-vocab overlap is a lower bound, so a hit here is always a duplicate
+    firsts = _first_duplicates(
+        cand_masks, [len(w) for w in word_sets],
+        masks, [len(t) for t in token_sets],
+        DUPLICATE_OVERLAP_RATIO,
+    )
+    incomplete = [idx for idx, ok in enumerate(complete) if not ok]
+    for i, oov in enumerate(oov_sets):
+        if not oov or not word_sets[i]:
+            continue
+        limit = firsts[i] if firsts[i] >= 0 else len(masks)
+        for idx in incomplete:
+            if idx >= limit:
+                break
+            overlap = (cand_masks[i] & masks[idx]).bit_count() + len(oov & token_sets[idx])
+            smaller = min(len(word_sets[i]), len(token_sets[idx]))
+            if overlap and overlap / smaller > DUPLICATE_OVERLAP_RATIO:
+                firsts[i] = idx
+                break
+    return firsts
+
+
+def validate_candidates(candidates: list, fact_index: tuple) -> list:
+    """Pre-commit quality gate. Returns one (keep: bool, reason: str) per candidate.
+
+    fact_index is the result of build_fact_index() over existing hot facts.
 
     Checks:
     1. Fact text quality (length, not a question, declarative)
-    2. Tighter duplicate pre-check against hot memories (word overlap > 60%)
+    2. Tighter duplicate pre-check against hot memories (word overlap > 60%),
+       run for all candidates in one bulk pass
     3. Entity enrichment (extract capitalized words if entities empty)
     """
-    fact_text = str(candidate.get("fact", "")).strip()
+    verdicts = [None] * len(candidates)
+    texts = [str(c.get("fact", "")).strip() for c in candidates]
+    gated = []
+    for i, fact_text in enumerate(texts):
+        # Quality gate: too short
+        if len(fact_text) < MIN_FACT_LENGTH:
+            verdicts[i] = (False, f"fact too short ({len(fact_text)} chars < {MIN_FACT_LENGTH})")
+        # Quality gate: questions aren't facts
+        elif fact_text.rstrip().endswith("?"):
+            verdicts[i] = (False, "fact is a question, not a statement")
+        else:
+            gated.append(i)
 
-    # Quality gate: too short
-    if len(fact_text) < MIN_FACT_LENGTH:
-        return False, f"fact too short ({len(fact_text)} chars < {MIN_FACT_LENGTH})"
+    existing_facts = fact_index[0]
+    duplicates = find_duplicates([texts[i] for i in gated], fact_index)
+    for i, dup in zip(gated, duplicates):
+        if dup >= 0:
+            verdicts[i] = (False, f"too similar to existing: '{existing_facts[dup][:60]}...'")
+            continue
 
-    # Quality gate: questions aren't facts
-    if fact_text.rstrip().endswith("?"):
-        return False, "fact is a question, not a statement"
+        # Entity enrichment: if entities list is empty, extract capitalized words
+        candidate = candidates[i]
+        if not candidate.get("entities", []):
+            enriched = [w for w in _CAPITALIZED_WORD_RE.findall(texts[i])
+                        if w not in _ENTITY_STOP_WORDS]
+            if enriched:
+                candidate["entities"] = enriched[:5]
+        verdicts[i] = (True, "passed")
+    return verdicts
 
-    # Tighter duplicate pre-check: word overlap > 60% with any existing hot fact
-    fact_words = set(fact_text.lower().split())
-    for existing in existing_hot_facts:
-        existing_words = set(existing.lower().split())
-        if not fact_words or not existing_words:
-            continue
-        overlap = len(fact_words & existing_words)
-        smaller = min(len(fact_words), len(existing_words))
-        if smaller > 0 and overlap / smaller > 0.6:
-            return False, f"too similar to existing: '{existing[:60]}...'"
 
-    # Entity enrichment: if entities list is empty, extract capitalized words
-    entities = candidate.get("entities", [])
-    if not entities:
-        enriched = [w for w in fact_text.split()
-                    if len(w) > 1 and w[0].isupper() and w not in ("The", "This", "That", "User")]
-        if enriched:
-            candidate["entities"] = enriched[:5]
-
-    return True, "passed"
-
-
-def _count_recent_additions() -> int:
-    """Count how many facts were added in the last hour (rate limiting)."""
-    memories = read_hot_memories()
-    if not memories:
-        return 0
-    one_hour_ago = (
-        datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=1)
-    ).isoformat()
-    count = 0
-    for mem in memories:
-        created = mem.get("metadata", {}).get("created_at", "")
-        if created > one_hour_ago:
-            count += 1
-    return count
+def validate_candidate(candidate: dict, fact_index: tuple) -> tuple:
+    """Single-candidate form of validate_candidates()."""
+    return validate_candidates([candidate], fact_index)[0]
+
+
+def _count_recent_additions(memories: list = None) -> int:
+    """Count how many facts were added in the last hour (rate limiting).
+
+    Uses the recent-adds sidecar when present; otherwise scans created_at.
+    """
+    sidecar_count = count_recent_adds()
+    if sidecar_count is not None:
+        return sidecar_count
+    if memories is None:
+        created_ats = iter_created_ats()
+    else:
+        created_ats = (created_at_epoch(m.get("metadata", {})) for m in memories)
+    one_hour_ago = time.time() - 3600
+    return sum(1 for created in created_ats if created > one_hour_ago)
 
 
 # ---------------------------------------------------------------------------
@@ -347,12 +634,17 @@ def search_existing_memories(query: str) -> list:
     capsule_results = search_capsule(query, collections=["aethervault-memory"], limit=3)
     # Search hot memories (warm storage) — this is the critical addition
     hot_results = search_hot_memories_text(query, limit=3)
-    # Combine, deduplicated
-    combined = list(capsule_results)
-    for r in hot_results:
-        if r not in combined:
+    # Combine, deduplicated (order-preserving)
+    seen = set()
+    combined = []
+    for r in capsule_results + hot_results:
+        key = r if isinstance(r, str) else r.get("fact", "")
+        if key not in seen:
+            seen.add(key)
             combined.append(r)
-    return combined[:5]
+            if len(combined) == 5:
+                break
+    return combined
 
 
 RECONCILE_SYSTEM = """\
@@ -391,14 +683,93 @@ def reconcile_fact(api_key: str, candidate: dict, existing: list) -> dict:
         f"EXISTING MEMORIES:\n{existing_text}"
     )
 
-    raw = call_claude(api_key, RECONCILE_SYSTEM, user_msg, max_tokens=256)
+    raw, data = call_claude_json(api_key, RECONCILE_SYSTEM, user_msg,
+                                 max_tokens=256, ttl_seconds=RECONCILE_CACHE_TTL_SECONDS,
+                                 validate=lambda d: isinstance(d, dict))
     if not raw:
         return {"operation": "ADD", "reason": "API fallback"}
-
-    try:
-        return parse_claude_json(raw)
-    except (json.JSONDecodeError, ValueError):
+    if data is None:
         return {"operation": "ADD", "reason": "parse fallback"}
+    return data
+
+
+RECONCILE_BATCH_SYSTEM = """\
+You are a memory reconciliation agent. You are given a JSON array of NEW facts,
+each with the EXISTING memories retrieved for it. For each item, determine what
+operation to perform.
+
+Respond with ONLY valid JSON (no markdown fences), one result per input item,
+in the same order as the input:
+
+{
+  "results": [
+    {
+      "operation": "ADD|UPDATE|DELETE|NOOP",
+      "reason": "brief explanation",
+      "updated_fact": "the reconciled fact text (only for UPDATE)",
+      "delete_target": "the existing fact text to invalidate (only for DELETE)"
+    }
+  ]
+}
+
+Rules:
+- ADD: The fact is genuinely new -- no existing memory covers it
+- UPDATE: An existing memory exists but needs updating (e.g., preference changed)
+- DELETE: The new fact contradicts/invalidates an existing memory (e.g., "I no longer like X")
+- NOOP: The fact is already known or too similar to existing memories
+- For UPDATE, provide the corrected/merged fact text in updated_fact
+- For DELETE, identify which existing memory should be invalidated in delete_target
+- Be conservative: prefer NOOP over ADD for marginal facts
+- Judge each item only against its own existing memories
+"""
+
+
+def reconcile_facts_batch(api_key: str, items: list) -> list:
+    """Reconcile many (candidate, existing) pairs with a single Claude call.
+
+    Returns one result dict per item, in order. Items without existing
+    memories are ADDs without asking Claude. If the batched response cannot
+    be parsed or does not line up with the input, falls back to one
+    reconcile_fact() call per item.
+    """
+    results = [None] * len(items)
+    batch = []
+    for idx, (candidate, existing) in enumerate(items):
+        if not existing:
+            results[idx] = {"operation": "ADD", "reason": "no existing memories found"}
+        else:
+            batch.append(idx)
+    if not batch:
+        return results
+
+    payload = [
+        {
+            "new_fact": items[idx][0]["fact"],
+            "category": items[idx][0].get("category", "general"),
+            "importance": items[idx][0].get("importance", 5),
+            "existing": list(items[idx][1][:5]),
+        }
+        for idx in batch
+    ]
+    user_msg = f"ITEMS:\n{json.dumps(payload, indent=2)}"
+    def lines_up(data) -> bool:
+        results = data.get("results") if isinstance(data, dict) else None
+        return (isinstance(results, list) and len(results) == len(batch)
+                and all(isinstance(r, dict) for r in results))
+
+    _, data = call_claude_json(api_key, RECONCILE_BATCH_SYSTEM, user_msg,
+                               max_tokens=256 * len(batch),
+                               ttl_seconds=RECONCILE_CACHE_TTL_SECONDS,
+                               validate=lines_up)
+    if data is None:
+        log_warn(f"Batched reconciliation unusable, falling back to {len(batch)} single calls")
+        for idx in batch:
+            results[idx] = reconcile_fact(api_key, *items[idx])
+        return results
+
+    for idx, result in zip(batch, data["results"]):
+        results[idx] = result
+    return results
 
 
 # ---------------------------------------------------------------------------
@@ -406,7 +777,8 @@ def reconcile_fact(api_key: str, candidate: dict, existing: list) -> dict:
 # ---------------------------------------------------------------------------
 
 def build_memory_metadata(candidate: dict) -> dict:
-    now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    now = datetime.datetime.now(datetime.timezone.utc)
+    now_iso = now.isoformat()
     importance = candidate.get("importance", 5)
     importance_norm = importance / 10.0
     return {
@@ -414,7 +786,9 @@ def build_memory_metadata(candidate: dict) -> dict:
         "importance": importance,
         "importance_normalized": round(importance_norm, 2),
         "created_at": now_iso,
+        "created_at_epoch": now.timestamp(),
         "last_accessed": now_iso,
+        "last_accessed_epoch": now.timestamp(),
         "access_count": 0,
         "decay_strength": 1.0,
         "decay_layer": "ltm" if importance_norm >= PROMOTE_THRESHOLD else "stm",
@@ -469,63 +843,104 @@ def update_knowledge_graph_bitemporal(entities: list, fact_text: str,
     }
     entity_type = type_mapping.get(category, "concept")
 
-    # Phase 1: Add all entities
-    for entity_name in clean_entities:
-        cmd = [
-            sys.executable, KNOWLEDGE_GRAPH_HOOK,
-            "add-entity",
-            "--name", entity_name,
-            "--type", entity_type,
-        ]
-        if dry_run:
-            log(f"DRY RUN: {' '.join(cmd)}")
-            continue
-        try:
-            subprocess.run(cmd, capture_output=True, text=True, timeout=15)
-        except Exception as e:
-            log_warn(f"KG entity add failed for '{entity_name}': {e}")
-
-    # Phase 2: Create relations between entity pairs
+    # Phase 1: all entities; Phase 2: relations from the first entity to each other one
+    batch = {
+        "entities": [{"name": name, "type": entity_type} for name in clean_entities],
+        "relations": [],
+    }
     if len(clean_entities) >= 2:
         relation = CATEGORY_RELATION_MAP.get(category, "related-to")
-        # Use first entity as source, relate it to each subsequent entity
         source = clean_entities[0]
         for target in clean_entities[1:]:
             if source.lower() == target.lower():
                 continue
-            cmd = [
-                sys.executable, KNOWLEDGE_GRAPH_HOOK,
-                "add-relation",
-                "--from", source,
-                "--relation", relation,
-                "--to", target,
-                "--confidence", "0.8",
-            ]
-            if dry_run:
-                log(f"DRY RUN: {' '.join(cmd)}")
-                continue
-            try:
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
-                if result.returncode == 0:
-                    log(f"KG relation: {source} --[{relation}]--> {target}")
-                else:
-                    log_warn(f"KG relation failed: {result.stderr.strip()}")
-            except Exception as e:
-                log_warn(f"KG relation add failed for '{source}' -> '{target}': {e}")
+            batch["relations"].append({
+                "from": source, "relation": relation, "to": target,
+                "confidence": 0.8,
+            })
+
+    if dry_run:
+        log(f"DRY RUN: knowledge-graph batch {json.dumps(batch)}")
+        return
+
+    kg = _load_kg_module()
+    if kg is not None:
+        # The hook prints its warnings (e.g. missing entities) to stdout; capture
+        # them so they reach the log with a timestamp and level like ours
+        hook_output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(hook_output):
+                with kg.graph_transaction() as G:
+                    kg.apply_batch(G, batch)
+            for rel in batch["relations"]:
+                log(f"KG relation: {rel['from']} --[{rel['relation']}]--> {rel['to']}")
+        except Exception as e:
+            log_warn(f"KG batch update failed for {clean_entities}: {e}")
+        finally:
+            for line in hook_output.getvalue().splitlines():
+                if line.strip():
+                    log_warn(f"knowledge-graph: {line.strip()}")
+    else:
+        _run_kg_batch_subprocess(batch, clean_entities)
 
-    if not dry_run and os.path.isfile(KNOWLEDGE_GRAPH_PATH):
+    if os.path.isfile(KNOWLEDGE_GRAPH_PATH):
         _ensure_bitemporal_fields()
 
 
+_kg_module = None
+_kg_import_failed = False
+
+
+def _load_kg_module():
+    """Import the knowledge-graph hook in-process (cached); None if unavailable."""
+    global _kg_module, _kg_import_failed
+    if _kg_module is None and not _kg_import_failed:
+        try:
+            spec = importlib.util.spec_from_file_location("knowledge_graph", KNOWLEDGE_GRAPH_HOOK)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _kg_module = module
+        except Exception as e:
+            log_warn(f"Could not import knowledge-graph hook, using subprocess: {e}")
+            _kg_import_failed = True
+    return _kg_module
+
+
+def _run_kg_batch_subprocess(batch: dict, clean_entities: list):
+    """Fallback: apply a KG batch via a single hook subprocess."""
+    cmd = [sys.executable, KNOWLEDGE_GRAPH_HOOK, "batch"]
+    try:
+        result = subprocess.run(cmd, input=json.dumps(batch), capture_output=True,
+                                text=True, timeout=15)
+        if result.returncode == 0:
+            for rel in batch["relations"]:
+                log(f"KG relation: {rel['from']} --[{rel['relation']}]--> {rel['to']}")
+        else:
+            log_warn(f"KG batch update failed: {result.stderr.strip()}")
+    except Exception as e:
+        log_warn(f"KG batch update failed for {clean_entities}: {e}")
+
+
 def _ensure_bitemporal_fields():
+    """One-time migration adding bi-temporal fields to legacy KG edges.
+
+    knowledge-graph.py and nightly-consolidation's direct fallback stamp
+    these fields on every edge they add, so once the migration is recorded
+    in the sidecar the graph never needs to be loaded here again.
+    """
+    try:
+        if load_json_file(KNOWLEDGE_GRAPH_META_PATH).get("bitemporal_version", 0) >= BITEMPORAL_VERSION:
+            return
+    except (json.JSONDecodeError, OSError, AttributeError):
+        pass
+
     try:
         # Guard against corrupt/huge KG file
         file_size = os.path.getsize(KNOWLEDGE_GRAPH_PATH)
         if file_size > 50 * 1024 * 1024:  # 50MB safety limit
             log_warn(f"Knowledge graph too large ({file_size / 1024 / 1024:.1f}MB), skipping bitemporal update")
             return
-        with open(KNOWLEDGE_GRAPH_PATH, "r") as f:
-            graph = json.load(f)
+        graph = load_json_file(KNOWLEDGE_GRAPH_PATH)
     except (json.JSONDecodeError, OSError):
         return
 
@@ -546,6 +961,12 @@ def _ensure_bitemporal_fields():
             log("Added bi-temporal fields to knowledge graph edges")
         except OSError as e:
             log_warn(f"Could not update KG: {e}")
+            return
+
+    try:
+        atomic_write_json(KNOWLEDGE_GRAPH_META_PATH, {"bitemporal_version": BITEMPORAL_VERSION})
+    except OSError as e:
+        log_warn(f"Could not record KG migration version: {e}")
 
 
 # ---------------------------------------------------------------------------
@@ -567,8 +988,10 @@ def run_extraction(window_minutes: int, force: bool, dry_run: bool):
         return
 
     # Check marker
+    marker = read_marker_data()
+    minutes_since = None
     if not force:
-        last_processed = read_marker()
+        last_processed = marker.get("last_processed", "")
         if last_processed:
             try:
                 last_ts = datetime.datetime.fromisoformat(last_processed.replace("Z", "+00:00"))
@@ -578,7 +1001,23 @@ def run_extraction(window_minutes: int, force: bool, dry_run: bool):
                     log(f"Last processed {minutes_since:.1f}m ago, skipping (< 3m)")
                     return
             except (ValueError, TypeError):
-                pass
+                minutes_since = None
+
+    # Adaptive wake: idle agent and recent run -> nothing worth querying
+    new_lines, log_position = count_new_log_lines()
+    if (new_lines is not None and minutes_since is not None
+            and new_lines < MIN_NEW_LOG_LINES and minutes_since < MAX_IDLE_MINUTES):
+        log(f"Only {new_lines} new log lines in {minutes_since:.1f}m, skipping "
+            f"(< {MIN_NEW_LOG_LINES} lines and < {MAX_IDLE_MINUTES}m)")
+        return
+    if log_position is not None and not dry_run:
+        save_log_position(log_position)
+
+    # The logs query dominates startup; parse hot memories alongside it
+    # (phases 1, 2 and the rate limiter all read them)
+    startup_pool = ThreadPoolExecutor(max_workers=1)
+    memories_future = startup_pool.submit(read_hot_memories)
+    startup_pool.shutdown(wait=False)
 
     # Query recent logs
     log(f"Querying agent logs (window: {window_minutes}m)...")
@@ -593,17 +1032,37 @@ def run_extraction(window_minutes: int, force: bool, dry_run: bool):
         record_success(COMPONENT_NAME)
         return
 
+    # Identical log window to the last fully processed run: nothing new to extract
+    logs_hash = hashlib.sha256(logs.encode("utf-8")).hexdigest()
+    if not force and marker.get("last_logs_sha256") == logs_hash:
+        log("Logs unchanged since last run, skipping extraction")
+        write_marker(datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                     logs_sha256=logs_hash)
+        record_success(COMPONENT_NAME)
+        return
+
+    if not force and is_low_signal(logs):
+        log("Low-signal window, skipping extraction")
+        write_marker(datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                     logs_sha256=logs_hash)
+        record_success(COMPONENT_NAME)
+        return
+
+    all_memories = memories_future.result()
+
     # Phase 1: Extract candidate facts
-    last_processed = read_marker() if not force else ""
+    last_processed = marker.get("last_processed", "") if not force else ""
     log("Phase 1: Extracting candidate facts...")
-    candidates = extract_facts(api_key, logs, marker_timestamp=last_processed)
+    candidates = extract_facts(api_key, logs, marker_timestamp=last_processed,
+                               memories=all_memories)
     if candidates is None:
         log_error("Extraction failed, marker NOT advanced")
         record_failure(COMPONENT_NAME, "Claude API extraction failed")
         return
     if not candidates:
         log("No facts extracted")
-        write_marker(datetime.datetime.now(datetime.timezone.utc).isoformat())
+        write_marker(datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                     logs_sha256=logs_hash)
         record_success(COMPONENT_NAME)
         return
 
@@ -615,19 +1074,21 @@ def run_extraction(window_minutes: int, force: bool, dry_run: bool):
 
     if not hot_candidates:
         log("No high-importance facts to process")
-        write_marker(datetime.datetime.now(datetime.timezone.utc).isoformat())
+        write_marker(datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                     logs_sha256=logs_hash)
         record_success(COMPONENT_NAME)
         return
 
     # Phase 2: Self-validation (quality gate + duplicate pre-check)
     log("Phase 2: Validating candidates...")
     existing_hot_facts = [
-        m.get("fact", "") for m in read_hot_memories()
+        m.get("fact", "") for m in all_memories
         if not m.get("metadata", {}).get("t_invalid") and m.get("fact")
     ]
+    fact_index = build_fact_index(existing_hot_facts)
     validated = []
-    for candidate in hot_candidates:
-        keep, reason = validate_candidate(candidate, existing_hot_facts)
+    verdicts = validate_candidates(hot_candidates, fact_index)
+    for candidate, (keep, reason) in zip(hot_candidates, verdicts):
         if keep:
             validated.append(candidate)
         else:
@@ -636,21 +1097,32 @@ def run_extraction(window_minutes: int, force: bool, dry_run: bool):
 
     if not validated:
         log("No candidates survived validation")
-        write_marker(datetime.datetime.now(datetime.timezone.utc).isoformat())
+        write_marker(datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                     logs_sha256=logs_hash)
         record_success(COMPONENT_NAME)
         return
 
     # Rate limiting: cap additions per hour to prevent extraction bursts
-    recent_adds = _count_recent_additions()
+    recent_adds = _count_recent_additions(memories=all_memories)
     budget = max(0, MAX_ADDITIONS_PER_HOUR - recent_adds)
     if budget == 0:
         log(f"Rate limit: {recent_adds} facts added in last hour (max {MAX_ADDITIONS_PER_HOUR}), deferring")
+        # No hash: deferred candidates must be re-extracted from these logs later
         write_marker(datetime.datetime.now(datetime.timezone.utc).isoformat())
         record_success(COMPONENT_NAME)
         return
     if len(validated) > budget:
         log(f"Rate limit: capping from {len(validated)} to {budget} candidates (budget remaining)")
         validated = validated[:budget]
+        logs_hash = ""  # capped candidates must be re-extracted from these logs later
+
+    # Existing-memory retrieval for Phase 3 is subprocess + disk bound; run it
+    # for every candidate within the rate limit in parallel
+    search_pool = ThreadPoolExecutor(max_workers=SEARCH_WORKERS)
+    searches = [
+        search_pool.submit(search_existing_memories, str(candidate.get("fact", "")).strip())
+        for candidate in validated
+    ]
 
     # Phase 3: Reconcile each fact against existing memories
     log("Phase 3: Reconciling against existing memories...")
@@ -660,16 +1132,21 @@ def run_extraction(window_minutes: int, force: bool, dry_run: bool):
     skipped = 0
     errors = 0
 
-    for candidate in validated:
+    pending = []
+    for candidate, search in zip(validated, searches):
         if not isinstance(candidate, dict):
             log_warn(f"Skipping non-dict candidate: {type(candidate).__name__}")
             continue
         fact_text = str(candidate.get("fact", "")).strip()
         if not fact_text:
             continue
+        pending.append((candidate, search.result()))
+    search_pool.shutdown()
+
+    results = reconcile_facts_batch(api_key, pending)
 
-        existing = search_existing_memories(fact_text)
-        result = reconcile_fact(api_key, candidate, existing)
+    for (candidate, _), result in zip(pending, results):
+        fact_text = str(candidate.get("fact", "")).strip()
         operation = result.get("operation", "NOOP")
         reason = result.get("reason", "")
         is_api_fallback = reason in ("API fallback", "parse fallback")
@@ -720,7 +1197,8 @@ def run_extraction(window_minutes: int, force: bool, dry_run: bool):
     # Marker advancement — only when no API errors
     if not dry_run:
         if errors == 0:
-            write_marker(datetime.datetime.now(datetime.timezone.utc).isoformat())
+            write_marker(datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                         logs_sha256=logs_hash)
             record_success(COMPONENT_NAME)
         else:
             log_warn(f"Had {errors} reconciliation errors, marker NOT advanced")
@@ -745,8 +1223,7 @@ def _accumulate_daily_digest(added: int, updated: int, deleted: int, skipped: in
     data = {}
     if os.path.isfile(DAILY_DIGEST_PATH):
         try:
-            with open(DAILY_DIGEST_PATH, "r") as f:
-                data = json.load(f)
+            data = load_json_file(DAILY_DIGEST_PATH)
         except (json.JSONDecodeError, OSError):
             data = {}
 
@@ -781,8 +1258,7 @@ def send_daily_digest():
         log("No digest data to send")
         return
     try:
-        with open(DAILY_DIGEST_PATH, "r") as f:
-            data = json.load(f)
+        data = load_json_file(DAILY_DIGEST_PATH)
     except (json.JSONDecodeError, OSError):
         log("Could not read digest data")
         return
@@ -819,22 +1295,19 @@ def deduplicate_hot_memories():
             log("No hot memories to deduplicate")
             return
 
-        # Group by normalized fact text (case-insensitive, stripped)
+        # Group by normalized fact text (case-insensitive, stripped), tracking
+        # only the index and creation time of the newest entry per fact
         seen = {}
-        for mem in memories:
-            fact = mem.get("fact", "").strip().lower()
+        for i, mem in enumerate(memories):
+            fact = mem.get("fact", "").strip().casefold()
             if not fact:
                 continue
-            created = mem.get("metadata", {}).get("created_at", "")
-            if fact in seen:
-                # Keep the one with the newer created_at
-                existing_created = seen[fact].get("metadata", {}).get("created_at", "")
-                if created > existing_created:
-                    seen[fact] = mem
-            else:
-                seen[fact] = mem
+            created = created_at_epoch(mem.get("metadata", {}))
+            best = seen.get(fact)
+            if best is None or created > best[1]:
+                seen[fact] = (i, created)
 
-        deduped = list(seen.values())
+        deduped = [memories[i] for i, _ in seen.values()]
         removed = len(memories) - len(deduped)
 
         if removed > 0:
@@ -860,12 +1333,17 @@ def main():
                         help=f"Look back N minutes (default: {DEFAULT_WINDOW_MINUTES})")
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("--force", action="store_true")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk LLM response cache")
     parser.add_argument("--dedup", action="store_true",
                         help="Deduplicate hot memories and exit")
     parser.add_argument("--send-digest", action="store_true",
                         help="Force-send the daily digest and exit")
     args = parser.parse_args()
 
+    global USE_LLM_CACHE
+    USE_LLM_CACHE = not args.no_cache
+
     if args.dedup:
         log("=== Deduplicating hot memories ===")
         deduplicate_hot_memories()
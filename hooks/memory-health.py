@@ -23,11 +23,23 @@ Usage:
 
 import argparse
 import datetime
+import functools
 import json
 import os
+import pwd
+import re
+import stat
 import subprocess
 import sys
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+# ciso8601 is optional; a C ISO-8601 parser, used for marker timestamps when present
+try:
+    import ciso8601
+    HAS_CISO8601 = True
+except ImportError:
+    HAS_CISO8601 = False
 
 # Add script directory to path for shared module import
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -37,25 +49,71 @@ from hot_memory_store import (
     HOT_MEMORY_PATH, ARCHIVE_PATH, HEALTH_PATH, FAILURE_PATH,
     MARKER_STALE_MINUTES, MIN_DISK_FREE_MB, CLAUDE_API_URL,
     load_env, log, log_error, log_warn,
-    read_hot_memories, cleanup_temp_files, rotate_archive,
-    prune_invalidated, send_telegram, atomic_write_json,
+    iter_hot_memories, cleanup_temp_files, rotate_archive,
+    prune_invalidated, send_telegram, atomic_write_json, load_json_file,
 )
 
 
+def _safe_stat(path: str):
+    """os.stat() for a regular file, or None if missing/unreadable/not a file."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+def _parse_utc_iso(value: str):
+    """Fast path for UTC timestamps as written by isoformat().
+
+    Accepts YYYY-MM-DDTHH:MM:SS[.ffffff] followed by Z or +00:00; returns
+    None for anything else so the caller can use the generic parser.
+    """
+    if value.endswith("Z"):
+        body = value[:-1]
+    elif value.endswith("+00:00"):
+        body = value[:-6]
+    else:
+        return None
+    n = len(body)
+    if (n not in (19, 26) or body[4] != "-" or body[7] != "-" or body[10] != "T"
+            or body[13] != ":" or body[16] != ":" or (n == 26 and body[19] != ".")):
+        return None
+    try:
+        return datetime.datetime(
+            int(body[0:4]), int(body[5:7]), int(body[8:10]),
+            int(body[11:13]), int(body[14:16]), int(body[17:19]),
+            int(body[20:26]) if n == 26 else 0,
+            tzinfo=datetime.timezone.utc,
+        )
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_iso(value: str) -> datetime.datetime:
+    """Parse an ISO-8601 timestamp (trailing Z allowed), memoized per string."""
+    if HAS_CISO8601:
+        return ciso8601.parse_datetime(value)
+    parsed = _parse_utc_iso(value)
+    if parsed is None:
+        parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed
+
+
 def check_marker_freshness() -> dict:
     """Check if the extractor marker is stale."""
     marker_path = os.path.join(AETHERVAULT_HOME, "data", "extractor-marker.json")
-    if not os.path.isfile(marker_path):
+    if _safe_stat(marker_path) is None:
         return {"status": "warn", "message": "No extractor marker found (never run?)"}
 
     try:
-        with open(marker_path, "r") as f:
-            data = json.load(f)
+        data = load_json_file(marker_path)
         last_processed = data.get("last_processed", "")
         if not last_processed:
             return {"status": "warn", "message": "Marker exists but empty"}
 
-        last_ts = datetime.datetime.fromisoformat(last_processed.replace("Z", "+00:00"))
+        last_ts = _parse_iso(last_processed)
         now = datetime.datetime.now(datetime.timezone.utc)
         minutes_since = (now - last_ts).total_seconds() / 60.0
 
@@ -76,14 +134,18 @@ def check_marker_freshness() -> dict:
 
 def check_hot_memories() -> dict:
     """Check hot memory file health."""
-    if not os.path.isfile(HOT_MEMORY_PATH):
+    if _safe_stat(HOT_MEMORY_PATH) is None:
         return {"status": "warn", "message": "No hot memories file"}
 
     try:
-        memories = read_hot_memories()
-        total = len(memories)
-        pinned = sum(1 for m in memories if m.get("metadata", {}).get("pinned"))
-        invalidated = sum(1 for m in memories if m.get("metadata", {}).get("t_invalid"))
+        total = pinned = invalidated = 0
+        for m in iter_hot_memories():
+            total += 1
+            meta = m.get("metadata") or {}
+            if meta.get("pinned"):
+                pinned += 1
+            if meta.get("t_invalid"):
+                invalidated += 1
         active = total - invalidated
 
         issues = []
@@ -106,15 +168,30 @@ def check_hot_memories() -> dict:
         return {"status": "critical", "message": f"Cannot read hot memories: {e}"}
 
 
+def _count_lines(path: str) -> int:
+    """Count lines by scanning 1MB binary blocks for newlines (no decoding)."""
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        while True:
+            buf = f.read(1 << 20)
+            if not buf:
+                break
+            count += buf.count(b"\n")
+            last = buf[-1:]
+    # A final line without a trailing newline still counts
+    return count + (last != b"\n")
+
+
 def check_archive_size() -> dict:
     """Check archive file size."""
-    if not os.path.isfile(ARCHIVE_PATH):
+    st = _safe_stat(ARCHIVE_PATH)
+    if st is None:
         return {"status": "ok", "message": "No archive file yet", "lines": 0}
 
     try:
-        with open(ARCHIVE_PATH, "r") as f:
-            line_count = sum(1 for _ in f)
-        size_mb = os.path.getsize(ARCHIVE_PATH) / (1024 * 1024)
+        line_count = _count_lines(ARCHIVE_PATH)
+        size_mb = st.st_size / (1024 * 1024)
 
         if line_count > 8000:
             return {
@@ -133,38 +210,37 @@ def check_archive_size() -> dict:
         return {"status": "warn", "message": f"Cannot read archive: {e}"}
 
 
+MIN_FREE_BYTES = MIN_DISK_FREE_MB << 20
+
+
+def _disk_result(status: str, prefix: str, free_bytes: int, total_bytes: int) -> dict:
+    free_mb = free_bytes / (1024 * 1024)
+    used_pct = ((total_bytes - free_bytes) / total_bytes * 100) if total_bytes > 0 else 0
+    return {
+        "status": status,
+        "message": f"{prefix}: {free_mb:.0f}MB free ({used_pct:.0f}% used)",
+        "free_mb": round(free_mb),
+        "used_pct": round(used_pct, 1),
+    }
+
+
 def check_disk_space() -> dict:
     """Check available disk space."""
     try:
         data_dir = os.path.dirname(HOT_MEMORY_PATH)
-        stat = os.statvfs(data_dir)
-        free_mb = (stat.f_bavail * stat.f_frsize) / (1024 * 1024)
-        total_mb = (stat.f_blocks * stat.f_frsize) / (1024 * 1024)
-        used_pct = ((total_mb - free_mb) / total_mb * 100) if total_mb > 0 else 0
-
-        if free_mb < MIN_DISK_FREE_MB:
-            return {
-                "status": "critical",
-                "message": f"Disk critically low: {free_mb:.0f}MB free ({used_pct:.0f}% used)",
-                "free_mb": round(free_mb),
-                "used_pct": round(used_pct, 1),
-            }
-        if free_mb < MIN_DISK_FREE_MB * 3:
-            return {
-                "status": "warn",
-                "message": f"Disk getting low: {free_mb:.0f}MB free ({used_pct:.0f}% used)",
-                "free_mb": round(free_mb),
-                "used_pct": round(used_pct, 1),
-            }
-        return {
-            "status": "ok",
-            "message": f"Disk: {free_mb:.0f}MB free ({used_pct:.0f}% used)",
-            "free_mb": round(free_mb),
-            "used_pct": round(used_pct, 1),
-        }
+        vfs = os.statvfs(data_dir)
     except OSError as e:
         return {"status": "warn", "message": f"Cannot check disk: {e}"}
 
+    # Thresholds compare in integer bytes; floats are only built for the report
+    free_bytes = vfs.f_bavail * vfs.f_frsize
+    total_bytes = vfs.f_blocks * vfs.f_frsize
+    if free_bytes < MIN_FREE_BYTES:
+        return _disk_result("critical", "Disk critically low", free_bytes, total_bytes)
+    if free_bytes < MIN_FREE_BYTES * 3:
+        return _disk_result("warn", "Disk getting low", free_bytes, total_bytes)
+    return _disk_result("ok", "Disk", free_bytes, total_bytes)
+
 
 def check_api_proxy() -> dict:
     """Check if the Claude API proxy is reachable."""
@@ -181,56 +257,135 @@ def check_api_proxy() -> dict:
         return {"status": "critical", "message": f"API proxy unreachable: {e}"}
 
 
+# The capsule query gets a short deadline while it is known to be warm, and
+# the full cold-start allowance when no recent success is on record
+CAPSULE_TIMEOUT_SECONDS = 3
+CAPSULE_COLD_TIMEOUT_SECONDS = 10
+CAPSULE_WARM_WINDOW_SECONDS = 3600
+
+
+def _capsule_last_ok():
+    """last_ok_at of the capsule check from the previous health report, or None."""
+    try:
+        previous = load_json_file(HEALTH_PATH)
+        last_ok = previous["checks"]["capsule"].get("last_ok_at")
+        return last_ok if isinstance(last_ok, str) else None
+    except (json.JSONDecodeError, OSError, KeyError, TypeError, AttributeError):
+        return None
+
+
 def check_capsule() -> dict:
     """Check if the capsule file exists and is queryable."""
-    if not os.path.isfile(CAPSULE_PATH):
+    st = _safe_stat(CAPSULE_PATH)
+    if st is None:
         return {"status": "critical", "message": f"Capsule not found at {CAPSULE_PATH}"}
 
-    size_mb = os.path.getsize(CAPSULE_PATH) / (1024 * 1024)
+    size_mb = st.st_size / (1024 * 1024)
 
-    if not os.path.isfile(AETHERVAULT_BIN):
+    if _safe_stat(AETHERVAULT_BIN) is None:
         binary = "aethervault"
     else:
         binary = AETHERVAULT_BIN
 
+    now = datetime.datetime.now(datetime.timezone.utc)
+    last_ok = _capsule_last_ok()
+    timeout = CAPSULE_COLD_TIMEOUT_SECONDS
+    if last_ok:
+        try:
+            if (now - _parse_iso(last_ok)).total_seconds() < CAPSULE_WARM_WINDOW_SECONDS:
+                timeout = CAPSULE_TIMEOUT_SECONDS
+        except (ValueError, TypeError):
+            pass
+
     try:
         result = subprocess.run(
             [binary, "query", "--collection", "agent-log", "--limit", "1",
              CAPSULE_PATH, "test"],
-            capture_output=True, text=True, timeout=10,
+            capture_output=True, text=True, timeout=timeout,
         )
         if result.returncode == 0:
             return {
                 "status": "ok",
                 "message": f"Capsule queryable ({size_mb:.1f}MB)",
                 "size_mb": round(size_mb, 1),
+                "last_ok_at": now.isoformat(),
             }
         return {
             "status": "warn",
             "message": f"Capsule query failed: {result.stderr.strip()[:100]}",
             "size_mb": round(size_mb, 1),
+            "last_ok_at": last_ok,
         }
     except FileNotFoundError:
         return {"status": "critical", "message": f"aethervault binary not found: {binary}"}
     except subprocess.TimeoutExpired:
-        return {"status": "warn", "message": "Capsule query timed out"}
+        return {"status": "warn", "message": f"Capsule query timed out ({timeout}s)",
+                "last_ok_at": last_ok}
     except Exception as e:
         return {"status": "warn", "message": f"Capsule check error: {e}"}
 
 
+CRON_CACHE_PATH = os.path.join(AETHERVAULT_HOME, "data", "crontab-cache.json")
+CRON_SPOOL_DIRS = ("/var/spool/cron/crontabs", "/var/spool/cron")  # Debian, RHEL
+CRON_JOBS = ("memory-extractor", "weekly-reflection", "memory-health")
+_CRON_JOBS_RE = re.compile("|".join(map(re.escape, CRON_JOBS)))
+
+
+def _crontab_cache_key():
+    """(spool path, mtime_ns, size) of the current user's crontab, or None."""
+    try:
+        user = pwd.getpwuid(os.getuid()).pw_name
+    except KeyError:
+        return None
+    for spool_dir in CRON_SPOOL_DIRS:
+        path = os.path.join(spool_dir, user)
+        st = _safe_stat(path)
+        if st is not None:
+            return [path, st.st_mtime_ns, st.st_size]
+    return None
+
+
+def _configured_cron_jobs():
+    """Names from CRON_JOBS present in the crontab, or None if it can't be read.
+
+    The result is cached on disk against the crontab spool file's mtime, so
+    cron-triggered runs skip forking `crontab -l` while it is unchanged.
+    """
+    key = _crontab_cache_key()
+    if key is not None:
+        try:
+            cached = load_json_file(CRON_CACHE_PATH)
+            if isinstance(cached, dict) and cached.get("key") == key:
+                return set(cached.get("jobs", []))
+        except (json.JSONDecodeError, OSError):
+            pass
+
+    result = subprocess.run(
+        ["crontab", "-l"], capture_output=True, text=True, timeout=5,
+    )
+    if result.returncode != 0:
+        return None
+    crontab = result.stdout
+    jobs = set(_CRON_JOBS_RE.findall(crontab))
+
+    if key is not None:
+        try:
+            atomic_write_json(CRON_CACHE_PATH, {"key": key, "jobs": sorted(jobs)})
+        except OSError:
+            pass
+    return jobs
+
+
 def check_cron() -> dict:
     """Check if memory cron jobs are configured."""
     try:
-        result = subprocess.run(
-            ["crontab", "-l"], capture_output=True, text=True, timeout=5,
-        )
-        if result.returncode != 0:
+        jobs = _configured_cron_jobs()
+        if jobs is None:
             return {"status": "warn", "message": "Cannot read crontab"}
 
-        crontab = result.stdout
-        has_extractor = "memory-extractor" in crontab
-        has_reflection = "weekly-reflection" in crontab
-        has_health = "memory-health" in crontab
+        has_extractor = "memory-extractor" in jobs
+        has_reflection = "weekly-reflection" in jobs
+        has_health = "memory-health" in jobs
 
         issues = []
         if not has_extractor:
@@ -252,12 +407,11 @@ def check_cron() -> dict:
 
 def check_failures() -> dict:
     """Check consecutive failure tracking."""
-    if not os.path.isfile(FAILURE_PATH):
+    if _safe_stat(FAILURE_PATH) is None:
         return {"status": "ok", "message": "No failures recorded", "components": {}}
 
     try:
-        with open(FAILURE_PATH, "r") as f:
-            data = json.load(f)
+        data = load_json_file(FAILURE_PATH)
 
         failures = data.get("failures", {})
         if not failures:
@@ -287,13 +441,16 @@ def check_failures() -> dict:
 def check_temp_files() -> dict:
     """Check for orphaned temp files."""
     data_dir = os.path.dirname(HOT_MEMORY_PATH)
-    if not os.path.isdir(data_dir):
-        return {"status": "ok", "message": "Data dir not found", "count": 0}
-
     orphans = []
-    for name in os.listdir(data_dir):
-        if name.endswith(".tmp") and name.startswith("."):
-            orphans.append(name)
+    try:
+        with os.scandir(data_dir) as it:
+            for entry in it:
+                name = entry.name
+                if (name.endswith(".tmp") and name.startswith(".")
+                        and entry.is_file(follow_symlinks=False)):
+                    orphans.append(name)
+    except (FileNotFoundError, NotADirectoryError):
+        return {"status": "ok", "message": "Data dir not found", "count": 0}
 
     if orphans:
         return {
@@ -308,72 +465,98 @@ def check_temp_files() -> dict:
 # Main health check
 # ---------------------------------------------------------------------------
 
+# Report order; every check is independent and returns its own dict
+_CHECK_FNS = {
+    "marker_freshness": check_marker_freshness,
+    "hot_memories": check_hot_memories,
+    "archive_size": check_archive_size,
+    "disk_space": check_disk_space,
+    "api_proxy": check_api_proxy,
+    "capsule": check_capsule,
+    "cron_jobs": check_cron,
+    "failure_tracking": check_failures,
+    "temp_files": check_temp_files,
+}
+
+
+# (check name, display label) in report order, and status -> report icon
+_CHECK_LABELS = tuple((name, name.replace("_", " ").title()) for name in _CHECK_FNS)
+_STATUS_ICONS = {"ok": "+", "warn": "~", "critical": "!"}
+
+
+def overall_status(checks: dict) -> str:
+    """Worst status across checks: critical > degraded > healthy."""
+    overall = "healthy"
+    for check in checks.values():
+        status = check["status"]
+        if status == "critical":
+            return "critical"
+        if status == "warn":
+            overall = "degraded"
+    return overall
+
+
 def run_health_check() -> dict:
-    """Run all health checks and return structured result."""
-    checks = {
-        "marker_freshness": check_marker_freshness(),
-        "hot_memories": check_hot_memories(),
-        "archive_size": check_archive_size(),
-        "disk_space": check_disk_space(),
-        "api_proxy": check_api_proxy(),
-        "capsule": check_capsule(),
-        "cron_jobs": check_cron(),
-        "failure_tracking": check_failures(),
-        "temp_files": check_temp_files(),
-    }
+    """Run all health checks and return structured result.
 
-    # Compute overall status
-    statuses = [c["status"] for c in checks.values()]
-    if "critical" in statuses:
-        overall = "critical"
-    elif "warn" in statuses:
-        overall = "degraded"
-    else:
-        overall = "healthy"
+    Checks run concurrently: the API probe, capsule query and crontab read
+    block on I/O, so wall time is the slowest check rather than the sum.
+    """
+    with ThreadPoolExecutor(max_workers=len(_CHECK_FNS)) as pool:
+        futures = {name: pool.submit(fn) for name, fn in _CHECK_FNS.items()}
+        checks = {name: fut.result() for name, fut in futures.items()}
 
     return {
-        "overall": overall,
+        "overall": overall_status(checks),
         "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
         "checks": checks,
     }
 
 
-def auto_fix(report: dict) -> list:
-    """Auto-fix recoverable issues. Returns list of actions taken."""
+def auto_fix(report: dict) -> tuple:
+    """Auto-fix recoverable issues.
+
+    Returns (actions taken, names of the checks whose state was touched).
+    """
     actions = []
+    affected = set()
 
     # Fix orphaned temp files
     if report["checks"]["temp_files"]["status"] != "ok":
         cleanup_temp_files()
         actions.append("Cleaned orphaned temp files")
+        affected.add("temp_files")
 
     # Fix archive bloat
     if report["checks"]["archive_size"]["status"] == "warn":
         rotate_archive()
         actions.append("Rotated archive file")
+        affected.add("archive_size")
 
     # Fix invalidated memory accumulation
     hm = report["checks"]["hot_memories"]
     if hm.get("invalidated", 0) > 10:
         prune_invalidated(max_age_hours=24.0)
         actions.append(f"Pruned invalidated memories older than 24h")
+        affected.add("hot_memories")
 
-    return actions
+    return actions, affected
 
 
 def format_report(report: dict) -> str:
     """Format health report as human-readable text."""
     lines = []
-    status_icon = {"ok": "+", "warn": "~", "critical": "!"}
-
     overall = report["overall"]
     lines.append(f"Memory System Health: {overall.upper()}")
     lines.append(f"Checked at: {report['timestamp']}")
     lines.append("-" * 50)
 
-    for name, check in report["checks"].items():
-        icon = status_icon.get(check["status"], "?")
-        label = name.replace("_", " ").title()
+    checks = report["checks"]
+    for name, label in _CHECK_LABELS:
+        check = checks.get(name)
+        if check is None:
+            continue
+        icon = _STATUS_ICONS.get(check["status"], "?")
         lines.append(f"  [{icon}] {label}: {check['message']}")
 
     return "\n".join(lines)
@@ -395,11 +578,13 @@ def main():
 
     # Auto-fix if requested
     if args.fix:
-        actions = auto_fix(report)
+        actions, affected = auto_fix(report)
         if actions:
-            report["auto_fix"] = actions
-            # Re-run checks after fix
-            report = run_health_check()
+            # Re-run only the checks whose state the fixes touched
+            for name in affected:
+                report["checks"][name] = _CHECK_FNS[name]()
+            report["overall"] = overall_status(report["checks"])
+            report["timestamp"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
             report["auto_fix"] = actions
 
     # Write health status for other scripts to read
@@ -411,14 +596,13 @@ def main():
     # Alert mode: only send Telegram on problems
     if args.alert_only:
         if report["overall"] == "critical":
-            critical_checks = [
-                f"  - {name}: {check['message']}"
-                for name, check in report["checks"].items()
-                if check["status"] == "critical"
-            ]
+            critical_lines = []
+            for name, check in report["checks"].items():
+                if check["status"] == "critical":
+                    critical_lines.append(f"  - {name}: {check['message']}")
             send_telegram(
-                f"[HEALTH CRITICAL] Memory system has {len(critical_checks)} critical issues:\n"
-                + "\n".join(critical_checks)
+                f"[HEALTH CRITICAL] Memory system has {len(critical_lines)} critical issues:\n"
+                + "\n".join(critical_lines)
             )
         return
 
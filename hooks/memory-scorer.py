@@ -27,27 +27,57 @@ Usage:
 
     # Prune memories below decay threshold:
     python3 memory-scorer.py prune --threshold 0.05 --dry-run
+
+    # Apply several reinforce/prune operations under one lock:
+    echo '[{"op": "reinforce", "fact": "purple"}, {"op": "prune"}]' | python3 memory-scorer.py batch
+
+    # Keep a warm scorer process for hooks (query it with scorer-client.sh):
+    python3 memory-scorer.py daemon
 """
 
 import argparse
+import bisect
+import collections
 import datetime
+import functools
+import heapq
+import itertools
 import json
 import math
+import operator
 import os
 import sys
+import time
+
+# numpy is optional; without it scoring runs as a per-memory Python loop
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# pyahocorasick is optional; batched reinforce falls back to one scan per fact
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 # Shared module (same directory)
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from hot_memory_store import (
+    HOT_MEMORY_PATH,
     LAMBDA_BASE, MU, BETA_LTM, BETA_STM, PROMOTE_THRESHOLD,
     RECENCY_DECAY_RATE,
     log, log_error, log_warn,
-    load_env,
+    AETHERVAULT_HOME,
+    load_env, json_loads, json_dumps, json_dumps_indented,
     read_hot_memories, write_hot_memories,
     hot_memory_lock, hot_memory_unlock,
     search_capsule,
-    compute_decay_strength, compute_recency,
+    compute_recency,
 )
+import socket_daemon
 
 # ---------------------------------------------------------------------------
 # Scorer-specific configuration
@@ -63,6 +93,16 @@ DEFAULT_ALPHA_DECAY = 0.3
 REINFORCE_DELTA = 0.15
 REINFORCE_N = 5
 PRUNE_THRESHOLD = 0.05  # memories below this strength can be pruned
+# Stored decay_strength is quantized to this many decimal places (keeps the
+# JSONL short; reports only show three)
+DECAY_STRENGTH_DIGITS = 6
+
+# Unix socket served by the daemon subcommand (see scorer-client.sh)
+SCORER_SOCK = os.path.join(AETHERVAULT_HOME, "run", "scorer.sock")
+
+# Decay parameters are tabulated over importance quantized to this many steps
+# (the extractor stores importance_normalized rounded to two places)
+IMPORTANCE_STEPS = 100
 
 
 # ---------------------------------------------------------------------------
@@ -79,7 +119,11 @@ def compute_composite_score(
     alpha_recency: float = DEFAULT_ALPHA_RECENCY,
     alpha_decay: float = DEFAULT_ALPHA_DECAY,
 ) -> float:
-    """Composite retrieval score combining all signals. Returns normalized [0, 1]."""
+    """Composite retrieval score combining all signals. Returns normalized [0, 1].
+
+    score_hot_memories() inlines this with pre-normalized weights; kept for
+    callers scoring a single memory.
+    """
     raw = (
         alpha_relevance * relevance
         + alpha_importance * importance
@@ -90,6 +134,63 @@ def compute_composite_score(
     return raw / max_possible if max_possible > 0 else 0.0
 
 
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11
+_FROMISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_iso(value: str):
+    """POSIX seconds of an ISO-8601 timestamp, memoized per string.
+
+    Returns None for unparseable or timezone-naive values (which can't be
+    compared with an aware "now"); callers treat those as "no timestamp".
+    """
+    try:
+        if not _FROMISO_ACCEPTS_Z and value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        dt = datetime.datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+    if dt.tzinfo is None:
+        return None
+    return dt.timestamp()
+
+
+def _metadata_epoch(metadata: dict, key: str):
+    """Epoch seconds of an ISO metadata timestamp such as created_at.
+
+    Prefers the numeric <key>_epoch field stored at write time; falls back
+    to parsing the ISO string for entries written before that field existed.
+    """
+    epoch = metadata.get(key + "_epoch")
+    if isinstance(epoch, (int, float)):
+        return float(epoch)
+    value = metadata.get(key)
+    return _parse_iso(value) if value else None
+
+
+_facts_buffer_cache = {"facts": None, "buffer": None}
+
+
+def _facts_buffer(facts: tuple) -> tuple:
+    """Lowercased facts joined into one NUL-separated string, plus each fact's start offset.
+
+    Lets reinforce search every fact with one C-level scan instead of a
+    Python loop per memory. Cached for the last fact tuple seen.
+    """
+    if _facts_buffer_cache["facts"] != facts:
+        lowered = [fact.lower() for fact in facts]
+        starts = list(itertools.accumulate((len(f) + 1 for f in lowered[:-1]), initial=0))
+        _facts_buffer_cache.update(facts=facts, buffer=("\0".join(lowered), starts))
+    return _facts_buffer_cache["buffer"]
+
+
+@functools.lru_cache(maxsize=4096)
+def _fact_tokens(fact: str) -> frozenset:
+    """Lowercased word set of a fact, cached per fact text."""
+    return frozenset(fact.lower().split())
+
+
 def reinforce_on_access(memory: dict) -> dict:
     """
     Boost memory strength when accessed (retrieved and used).
@@ -104,98 +205,306 @@ def reinforce_on_access(memory: dict) -> dict:
     n = metadata.get("access_count", 0)
 
     boost = REINFORCE_DELTA * (1.0 - v) * math.exp(-n / REINFORCE_N)
-    metadata["decay_strength"] = min(1.0, v + boost)
+    metadata["decay_strength"] = round(min(1.0, v + boost), DECAY_STRENGTH_DIGITS)
     metadata["access_count"] = n + 1
-    metadata["last_accessed"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    # The epoch field is what the scorer reads; the ISO string is for humans
+    now_ts = time.time()
+    metadata["last_accessed_epoch"] = now_ts
+    metadata["last_accessed"] = datetime.datetime.fromtimestamp(
+        now_ts, datetime.timezone.utc).isoformat()
 
     memory["metadata"] = metadata
     return memory
 
 
-def score_hot_memories(query: str, weights: dict) -> list:
+@functools.lru_cache(maxsize=256)
+def _decay_params(importance: float) -> tuple:
+    """(lambda_i, beta) of the FadeMem decay curve for an importance value."""
+    lambda_i = LAMBDA_BASE * math.exp(-MU * importance)
+    beta = BETA_LTM if importance >= PROMOTE_THRESHOLD else BETA_STM
+    return lambda_i, beta
+
+
+def _decay_strength(importance: float, days_elapsed: float) -> float:
+    """compute_decay_strength with the per-importance constants memoized."""
+    if days_elapsed <= 0:
+        return 1.0
+    lambda_i, beta = _decay_params(importance)
+    return max(0.0, min(1.0, math.exp(-lambda_i * (days_elapsed ** beta))))
+
+
+@functools.lru_cache(maxsize=256)
+def _half_life(importance: float) -> float:
+    """Days until a fresh memory of this importance decays to half strength."""
+    lambda_i, beta = _decay_params(importance)
+    if lambda_i > 0:
+        return (math.log(2) / lambda_i) ** (1.0 / beta)
+    return float('inf')
+
+
+if HAS_NUMPY:
+    _IMP_BUCKETS = np.arange(IMPORTANCE_STEPS + 1) / IMPORTANCE_STEPS
+    _LAMBDA_TABLE = LAMBDA_BASE * np.exp(-MU * _IMP_BUCKETS)
+    _BETA_TABLE = np.where(_IMP_BUCKETS >= PROMOTE_THRESHOLD, BETA_LTM, BETA_STM)
+
+
+def _decay_strength_array(importance, days):
+    """Vectorized compute_decay_strength over numpy arrays.
+
+    lambda_i and beta come from the importance lookup tables when every
+    importance sits on the quantization grid, and are computed otherwise.
     """
-    Score and rank hot memories against a query.
-    Returns list of (memory, score, breakdown) tuples sorted by score descending.
+    idx = np.rint(importance * IMPORTANCE_STEPS)
+    if (np.all((idx >= 0) & (idx <= IMPORTANCE_STEPS))
+            and np.array_equal(idx / IMPORTANCE_STEPS, importance)):
+        idx = idx.astype(np.intp)
+        lambda_i = _LAMBDA_TABLE[idx]
+        beta = _BETA_TABLE[idx]
+    else:
+        lambda_i = LAMBDA_BASE * np.exp(-MU * importance)
+        beta = np.where(importance >= PROMOTE_THRESHOLD, BETA_LTM, BETA_STM)
+    strength = np.clip(np.exp(-lambda_i * np.power(np.maximum(days, 0.0), beta)), 0.0, 1.0)
+    return np.where(days <= 0, 1.0, strength)
+
+
+def _recency_array(hours):
+    """Vectorized compute_recency over a numpy array."""
+    return np.where(hours <= 0, 1.0, np.power(RECENCY_DECAY_RATE, hours))
+
+
+_token_index_cache = {"facts": None, "index": None}
+
+
+def _fact_token_index(facts: tuple) -> tuple:
+    """Token-id index over fact texts, cached for the last fact tuple seen.
+
+    Returns (vocab, ids, owners): each fact's unique lowercased tokens as
+    vocabulary ids in one flat int array, with the owning fact's position
+    alongside. Fact strings are interned on load, so the cache check is
+    mostly identity comparisons.
     """
-    memories = read_hot_memories()
-    if not memories:
+    if _token_index_cache["facts"] != facts:
+        vocab = {}
+        ids = []
+        owners = []
+        for i, fact in enumerate(facts):
+            for token in _fact_tokens(fact):
+                ids.append(vocab.setdefault(token, len(vocab)))
+                owners.append(i)
+        _token_index_cache["facts"] = facts
+        _token_index_cache["index"] = (
+            vocab, np.array(ids, dtype=np.int32), np.array(owners, dtype=np.int32),
+        )
+    return _token_index_cache["index"]
+
+
+def _relevance_array(query: str, facts: tuple):
+    """Keyword-overlap relevance of every fact: |query & fact| / |query|, capped at 1."""
+    query_words = set(query.lower().split())
+    if not query_words or not facts:
+        return np.zeros(len(facts))
+    vocab, ids, owners = _fact_token_index(facts)
+    # Presence bitmap of query tokens over the vocabulary; overlap is a gather + bincount
+    presence = np.zeros(len(vocab))
+    for word in query_words:
+        token_id = vocab.get(word)
+        if token_id is not None:
+            presence[token_id] = 1.0
+    overlap = np.bincount(owners, weights=presence[ids], minlength=len(facts))
+    return np.minimum(1.0, overlap / len(query_words))
+
+
+_BREAKDOWN_KEYS = ("relevance", "importance", "recency", "decay", "composite")
+
+_hot_cache = {"key": None, "memories": None, "inputs": None}
+
+
+def _cached_read_hot_memories() -> list:
+    """read_hot_memories(), reused while the file's mtime and size are unchanged.
+
+    Callers must treat the returned list as read-only; anything that
+    modifies memories reads its own copy under the lock.
+    """
+    try:
+        st = os.stat(HOT_MEMORY_PATH)
+    except OSError:
+        _invalidate_hot_cache()
         return []
+    key = (st.st_mtime_ns, st.st_size)
+    if _hot_cache["key"] != key:
+        _hot_cache.update(key=key, memories=read_hot_memories(), inputs=None)
+    return _hot_cache["memories"]
+
+
+def _invalidate_hot_cache():
+    _hot_cache.update(key=None, memories=None, inputs=None)
 
-    now = datetime.datetime.now(datetime.timezone.utc)
-    scored = []
 
+def _score_inputs(memories: list) -> tuple:
+    """Query- and clock-independent scoring inputs of the valid memories.
+
+    Returns (kept, facts, importances, accessed, created, stored) where
+    accessed/created are epoch seconds or None. Gathered in one pass and
+    cached alongside the hot store it was built from.
+    """
+    if _hot_cache["memories"] is memories and _hot_cache["inputs"] is not None:
+        return _hot_cache["inputs"]
+
+    kept = []
+    facts, importances, accessed, created, stored = [], [], [], [], []
     for mem in memories:
         metadata = mem.get("metadata", {})
-        fact_text = mem.get("fact", "")
 
         # Skip invalidated memories (bi-temporal DELETE)
         if metadata.get("t_invalid"):
             continue
 
-        # Relevance: simple keyword overlap (hot memories are small enough for this)
-        query_words = set(query.lower().split())
-        fact_words = set(fact_text.lower().split())
-        overlap = len(query_words & fact_words)
-        relevance = min(1.0, overlap / max(1, len(query_words)))
+        # Relevance: keyword overlap, computed per fact at query time
+        facts.append(mem.get("fact", ""))
 
         # Importance
-        importance = metadata.get("importance_normalized", 0.5)
+        importances.append(metadata.get("importance_normalized", 0.5))
 
         # Recency
-        last_accessed = metadata.get("last_accessed", metadata.get("created_at", ""))
-        hours_since = 0
-        if last_accessed:
-            try:
-                la_dt = datetime.datetime.fromisoformat(last_accessed.replace("Z", "+00:00"))
-                hours_since = (now - la_dt).total_seconds() / 3600.0
-            except (ValueError, TypeError):
-                pass
-        recency = compute_recency(hours_since)
-
-        # Decay — use stored value if recent, otherwise recompute
-        stored_decay = metadata.get("decay_strength")
-        created_at = metadata.get("created_at", "")
-        days_elapsed = 0
-        if created_at:
-            try:
-                cr_dt = datetime.datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                days_elapsed = (now - cr_dt).total_seconds() / 86400.0
-            except (ValueError, TypeError):
-                pass
-        computed_decay = compute_decay_strength(importance, days_elapsed)
-        # Use stored decay_strength (includes reinforcement boosts) if present,
-        # but take the min with computed to ensure time-based decay still applies
-        if stored_decay is not None:
-            decay = min(stored_decay, computed_decay)
+        accessed.append(_metadata_epoch(
+            metadata, "last_accessed" if "last_accessed" in metadata else "created_at"))
+
+        # Decay inputs — stored value (includes reinforcement boosts) and age
+        created.append(_metadata_epoch(metadata, "created_at"))
+        stored.append(metadata.get("decay_strength"))
+        kept.append(mem)
+
+    inputs = (kept, tuple(facts), importances, accessed, created, stored)
+    if _hot_cache["memories"] is memories:
+        _hot_cache["inputs"] = inputs
+    return inputs
+
+
+def score_hot_memories(query: str, weights: dict, limit: int = None) -> list:
+    """
+    Score and rank hot memories against a query.
+    Returns list of (memory, score, breakdown) tuples sorted by score descending,
+    truncated to limit when given.
+    """
+    memories = _cached_read_hot_memories()
+    if not memories:
+        return []
+
+    now_ts = time.time()
+    w_rel = weights.get("relevance", DEFAULT_ALPHA_RELEVANCE)
+    w_imp = weights.get("importance", DEFAULT_ALPHA_IMPORTANCE)
+    w_rec = weights.get("recency", DEFAULT_ALPHA_RECENCY)
+    w_dec = weights.get("decay", DEFAULT_ALPHA_DECAY)
+    # Normalize the weights once so each score is a plain weighted sum
+    total = w_rel + w_imp + w_rec + w_dec
+    inv_total = 1.0 / total if total > 0 else 0.0
+    w_rel, w_imp, w_rec, w_dec = (
+        w_rel * inv_total, w_imp * inv_total, w_rec * inv_total, w_dec * inv_total)
+
+    kept, facts, importances, accessed, created, stored = _score_inputs(memories)
+    if not kept:
+        return []
+    hours = [(now_ts - ts) / 3600.0 if ts is not None else 0 for ts in accessed]
+    days = [(now_ts - ts) / 86400.0 if ts is not None else 0 for ts in created]
+
+    if HAS_NUMPY:
+        rel = _relevance_array(query, facts)
+        imp = np.array(importances, dtype=np.float64)
+        hours_arr = np.array(hours, dtype=np.float64)
+        days_arr = np.array(days, dtype=np.float64)
+        stored_arr = np.array([np.nan if v is None else v for v in stored], dtype=np.float64)
+        rec = _recency_array(hours_arr)
+        computed = _decay_strength_array(imp, days_arr)
+        # Stored decay is capped by the computed value so time-based decay still applies
+        dec = np.where(np.isnan(stored_arr), computed, np.minimum(stored_arr, computed))
+        composite = w_rel * rel + w_imp * imp + w_rec * rec + w_dec * dec
+        if limit is not None and 0 < limit < len(composite):
+            # Partial selection: keep everything tied with the k-th best score,
+            # then stable-sort that short list so ties keep store order
+            kth = np.partition(composite, len(composite) - limit)[len(composite) - limit]
+            candidates = np.flatnonzero(composite >= kth)
+            order = candidates[np.argsort(-composite[candidates], kind="stable")][:limit]
         else:
-            decay = computed_decay
-
-        # Composite score
-        score = compute_composite_score(
-            relevance, importance, recency, decay,
-            weights.get("relevance", DEFAULT_ALPHA_RELEVANCE),
-            weights.get("importance", DEFAULT_ALPHA_IMPORTANCE),
-            weights.get("recency", DEFAULT_ALPHA_RECENCY),
-            weights.get("decay", DEFAULT_ALPHA_DECAY),
-        )
+            order = np.argsort(-composite, kind="stable")
+            if limit is not None:
+                order = order[:limit]
+        # Project and round the returned rows' columns in one go
+        table = np.column_stack((rel[order], imp[order], rec[order], dec[order], composite[order]))
+        rounded = np.round(table, 3).tolist()
+        return [
+            (kept[i], score, dict(zip(_BREAKDOWN_KEYS, r)))
+            for i, score, r in zip(order.tolist(), composite[order].tolist(), rounded)
+        ]
+    else:
+        # Relevance: simple keyword overlap (hot memories are small enough for this)
+        query_words = frozenset(query.lower().split())
+        query_len = max(1, len(query_words))
+        relevances = [
+            min(1.0, len(query_words & _fact_tokens(fact)) / query_len)
+            for fact in facts
+        ]
+        rows = []
+        for i in range(len(kept)):
+            recency = compute_recency(hours[i])
+            computed_decay = _decay_strength(importances[i], days[i])
+            # Use stored decay_strength (includes reinforcement boosts) if present,
+            # but take the min with computed to ensure time-based decay still applies
+            decay = computed_decay if stored[i] is None else min(stored[i], computed_decay)
+            score = (w_rel * relevances[i] + w_imp * importances[i]
+                     + w_rec * recency + w_dec * decay)
+            rows.append((i, relevances[i], importances[i], recency, decay, score))
+        # Top rows by composite score, descending (nlargest is stable like sort)
+        if limit is not None and limit >= 0:
+            rows = heapq.nlargest(limit, rows, key=operator.itemgetter(5))
+        else:
+            rows.sort(key=operator.itemgetter(5), reverse=True)
+
+    # Breakdown dicts only for the rows actually returned
+    return [
+        (kept[i], score, dict(zip(_BREAKDOWN_KEYS, (
+            round(relevance, 3), round(float(importance), 3), round(recency, 3),
+            round(decay, 3), round(score, 3),
+        ))))
+        for i, relevance, importance, recency, decay, score in rows
+    ]
 
-        scored.append((mem, score, {
-            "relevance": round(relevance, 3),
-            "importance": round(importance, 3),
-            "recency": round(recency, 3),
-            "decay": round(decay, 3),
-            "composite": round(score, 3),
-        }))
 
-    # Sort by composite score descending
-    scored.sort(key=lambda x: x[1], reverse=True)
-    return scored
+def _decay_inputs(memories: list, now_ts: float) -> tuple:
+    """(importances, days since creation) of every memory, for decay-report and prune."""
+    importances, days = [], []
+    for mem in memories:
+        metadata = mem.get("metadata", {})
+        importances.append(metadata.get("importance_normalized", 0.5))
+        cr_ts = _metadata_epoch(metadata, "created_at")
+        days.append((now_ts - cr_ts) / 86400.0 if cr_ts is not None else 0)
+    return importances, days
+
+
+def _decay_strengths(importances: list, days: list) -> list:
+    """Current decay strength of every memory."""
+    if HAS_NUMPY:
+        return _decay_strength_array(np.array(importances, dtype=np.float64),
+                                     np.array(days, dtype=np.float64)).tolist()
+    return [_decay_strength(imp, d) for imp, d in zip(importances, days)]
 
 
 # ---------------------------------------------------------------------------
 # Commands
 # ---------------------------------------------------------------------------
 
+def _search_document(query: str, weights: dict, hot_results: list, capsule_results: list) -> dict:
+    """JSON document for a search (as printed by search --format json)."""
+    return {
+        "query": query,
+        "weights": weights,
+        "hot_memories": [
+            {"fact": mem.get("fact", ""), "score": breakdown, "metadata": mem.get("metadata", {})}
+            for mem, _, breakdown in hot_results
+        ],
+        "capsule_matches": capsule_results,
+    }
+
+
 def cmd_search(args):
     """Search and score memories."""
     load_env()
@@ -208,40 +517,27 @@ def cmd_search(args):
         "decay": args.alpha_decay,
     }
 
-    # Score hot memories
-    hot_results = score_hot_memories(query, weights)
+    # Score hot memories (already truncated to the limit)
+    hot_results = score_hot_memories(query, weights, limit=args.limit)
 
     # Also search capsule for broader results
     capsule_results = search_capsule(query, limit=args.limit)
 
-    # Output
-    output = {
-        "query": query,
-        "weights": weights,
-        "hot_memories": [],
-        "capsule_matches": capsule_results[:args.limit],
-    }
-
-    for mem, score, breakdown in hot_results[:args.limit]:
-        output["hot_memories"].append({
-            "fact": mem.get("fact", ""),
-            "score": breakdown,
-            "metadata": mem.get("metadata", {}),
-        })
-
     if args.format == "json":
-        print(json.dumps(output, indent=2, default=str))
+        output = _search_document(query, weights, hot_results, capsule_results[:args.limit])
+        sys.stdout.flush()
+        sys.stdout.buffer.write(json_dumps_indented(output, default=str) + b"\n")
+        sys.stdout.buffer.flush()
     else:
         print(f"\n{'='*60}")
         print(f"Query: {query}")
         print(f"{'='*60}")
 
-        if output["hot_memories"]:
-            print(f"\nHot Memories ({len(output['hot_memories'])} results):")
+        if hot_results:
+            print(f"\nHot Memories ({len(hot_results)} results):")
             print("-" * 40)
-            for i, hm in enumerate(output["hot_memories"], 1):
-                s = hm["score"]
-                print(f"  {i}. [{s['composite']:.3f}] {hm['fact'][:80]}")
+            for i, (mem, _, s) in enumerate(hot_results, 1):
+                print(f"  {i}. [{s['composite']:.3f}] {mem.get('fact', '')[:80]}")
                 print(f"     rel={s['relevance']:.2f} imp={s['importance']:.2f} "
                       f"rec={s['recency']:.2f} dec={s['decay']:.2f}")
         else:
@@ -254,6 +550,74 @@ def cmd_search(args):
                 print(f"  {i}. {cr[:100]}")
 
 
+def _reinforce_logged(mem: dict):
+    """reinforce_on_access() plus the before/after log line."""
+    before = mem.get("metadata", {}).get("decay_strength", 1.0)
+    mem = reinforce_on_access(mem)
+    after = mem["metadata"]["decay_strength"]
+    log(f"Reinforced: {mem['fact'][:60]}... ({before:.3f} -> {after:.3f})")
+
+
+def _reinforce_matching(memories: list, fact: str) -> bool:
+    """Reinforce, in place, every memory whose fact contains fact (case-insensitive)."""
+    needle = fact.lower()
+    hits = []
+    if memories and "\0" not in needle:
+        text, starts = _facts_buffer(tuple(mem.get("fact", "") for mem in memories))
+        pos = text.find(needle)
+        while pos != -1:
+            # Matches can't span the NUL separators, so pos lies inside one fact
+            i = bisect.bisect_right(starts, pos) - 1
+            hits.append(i)
+            if i + 1 == len(starts):
+                break
+            pos = text.find(needle, starts[i + 1])
+
+    for i in hits:
+        _reinforce_logged(memories[i])
+    if not hits:
+        log_error(f"No memory matching '{fact}' found")
+    return bool(hits)
+
+
+def _reinforce_many(memories: list, facts: list) -> bool:
+    """_reinforce_matching() for several facts, in place.
+
+    With pyahocorasick installed, all facts go into one automaton and the
+    facts buffer is scanned once; a memory matched by k of the facts is
+    reinforced k times, exactly as running the facts one after another.
+    """
+    needles = collections.Counter(fact.lower() for fact in facts)
+    if (not HAS_AHOCORASICK or len(needles) < 2 or not memories
+            or any("\0" in needle or not needle for needle in needles)):
+        found = False
+        for fact in facts:
+            found |= _reinforce_matching(memories, fact)
+        return found
+
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+
+    text, starts = _facts_buffer(tuple(mem.get("fact", "") for mem in memories))
+    hits = collections.defaultdict(set)
+    for end, needle in automaton.iter(text):
+        hits[bisect.bisect_right(starts, end - len(needle) + 1) - 1].add(needle)
+
+    matched = set()
+    for i in sorted(hits):
+        for needle in hits[i]:
+            for _ in range(needles[needle]):
+                _reinforce_logged(memories[i])
+        matched |= hits[i]
+
+    for fact in facts:
+        if fact.lower() not in matched:
+            log_error(f"No memory matching '{fact}' found")
+    return bool(matched)
+
+
 def cmd_reinforce(args):
     """Reinforce a memory by its fact text (with file locking)."""
     load_env()
@@ -261,72 +625,63 @@ def cmd_reinforce(args):
     lock_fd = hot_memory_lock()
     try:
         memories = read_hot_memories()
-        found = False
-
-        for mem in memories:
-            if args.fact.lower() in mem.get("fact", "").lower():
-                before = mem.get("metadata", {}).get("decay_strength", 1.0)
-                mem = reinforce_on_access(mem)
-                after = mem["metadata"]["decay_strength"]
-                log(f"Reinforced: {mem['fact'][:60]}... ({before:.3f} -> {after:.3f})")
-                found = True
-
-        if found:
+        if _reinforce_matching(memories, args.fact):
             write_hot_memories(memories)
-        else:
-            log_error(f"No memory matching '{args.fact}' found")
+            _invalidate_hot_cache()
     finally:
         hot_memory_unlock(lock_fd)
 
 
-def cmd_decay_report(args):
-    """Show decay status for all hot memories."""
-    load_env()
-
-    memories = read_hot_memories()
+def decay_report() -> list:
+    """Decay status rows (fact, layer, age, strength, half-life, ...) for all hot memories."""
+    memories = _cached_read_hot_memories()
     if not memories:
-        print("No hot memories found.")
-        return
+        return []
 
-    now = datetime.datetime.now(datetime.timezone.utc)
+    now_ts = time.time()
+
+    importances, days = _decay_inputs(memories, now_ts)
+    strengths = _decay_strengths(importances, days)
+    # Round the numeric columns in bulk
+    if HAS_NUMPY:
+        ages = np.round(np.array(days, dtype=np.float64), 1).tolist()
+        strengths = np.round(np.array(strengths, dtype=np.float64), 3).tolist()
+    else:
+        ages = [round(d, 1) for d in days]
+        strengths = [round(strength, 3) for strength in strengths]
 
     report = []
-    for mem in memories:
+    for mem, importance, age_days, current_strength in zip(
+            memories, importances, ages, strengths):
         metadata = mem.get("metadata", {})
-        importance = metadata.get("importance_normalized", 0.5)
-
-        created_at = metadata.get("created_at", "")
-        days_elapsed = 0
-        if created_at:
-            try:
-                cr_dt = datetime.datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                days_elapsed = (now - cr_dt).total_seconds() / 86400.0
-            except (ValueError, TypeError):
-                pass
-
-        current_strength = compute_decay_strength(importance, days_elapsed)
         layer = "LTM" if importance >= PROMOTE_THRESHOLD else "STM"
 
-        # Compute half-life
-        lambda_i = LAMBDA_BASE * math.exp(-MU * importance)
-        beta = BETA_LTM if importance >= PROMOTE_THRESHOLD else BETA_STM
-        if lambda_i > 0:
-            half_life_days = (math.log(2) / lambda_i) ** (1.0 / beta)
-        else:
-            half_life_days = float('inf')
-
         report.append({
             "fact": mem.get("fact", "")[:60],
             "importance": metadata.get("importance", 5),
             "layer": layer,
-            "age_days": round(days_elapsed, 1),
-            "strength": round(current_strength, 3),
-            "half_life_days": round(half_life_days, 1),
+            "age_days": age_days,
+            "strength": current_strength,
+            "half_life_days": round(_half_life(importance), 1),
             "access_count": metadata.get("access_count", 0),
         })
 
+    return report
+
+
+def cmd_decay_report(args):
+    """Show decay status for all hot memories."""
+    load_env()
+
+    report = decay_report()
+    if not report:
+        print("No hot memories found.")
+        return
+
     if args.format == "json":
-        print(json.dumps(report, indent=2))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(json_dumps_indented(report) + b"\n")
+        sys.stdout.buffer.flush()
     else:
         print(f"\n{'Fact':<62} {'Imp':>3} {'Layer':>5} {'Age':>6} {'Str':>6} {'T½':>6} {'Acc':>4}")
         print("-" * 100)
@@ -336,58 +691,160 @@ def cmd_decay_report(args):
                   f"{r['half_life_days']:>5.1f}d {r['access_count']:>4}")
 
 
+def _prune_decayed(memories: list, threshold: float, dry_run: bool = False) -> list:
+    """Memories at or above the decay threshold; logs the ones that fall below."""
+    now_ts = time.time()
+    strengths = _decay_strengths(*_decay_inputs(memories, now_ts))
+
+    keep = [mem for mem, strength in zip(memories, strengths) if strength >= threshold]
+    pruned = [(mem, strength) for mem, strength in zip(memories, strengths) if strength < threshold]
+
+    if pruned:
+        for mem, strength in pruned:
+            log(f"{'PRUNE' if not dry_run else 'WOULD PRUNE'}: "
+                f"{mem.get('fact', '')[:60]}... (strength={strength:.4f})")
+        if not dry_run:
+            log(f"Pruned {len(pruned)} memories, kept {len(keep)}")
+        else:
+            log(f"DRY RUN: would prune {len(pruned)}, keep {len(keep)}")
+    else:
+        log(f"No memories below threshold {threshold}")
+    return keep
+
+
 def cmd_prune(args):
     """Prune memories below decay threshold (with file locking)."""
     load_env()
 
     lock_fd = hot_memory_lock()
     try:
-        memories = read_hot_memories()
+        memories = _cached_read_hot_memories()
         if not memories:
             print("No hot memories to prune.")
             return
 
-        now = datetime.datetime.now(datetime.timezone.utc)
-        threshold = args.threshold
-        keep = []
-        pruned = []
-
-        for mem in memories:
-            metadata = mem.get("metadata", {})
-            importance = metadata.get("importance_normalized", 0.5)
+        keep = _prune_decayed(memories, args.threshold, args.dry_run)
+        if not args.dry_run and len(keep) < len(memories):
+            write_hot_memories(keep)
+            _invalidate_hot_cache()
+    finally:
+        hot_memory_unlock(lock_fd)
 
-            created_at = metadata.get("created_at", "")
-            days_elapsed = 0
-            if created_at:
-                try:
-                    cr_dt = datetime.datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    days_elapsed = (now - cr_dt).total_seconds() / 86400.0
-                except (ValueError, TypeError):
-                    pass
 
-            strength = compute_decay_strength(importance, days_elapsed)
+def apply_batch(ops: list) -> bool:
+    """Apply reinforce/prune operations in order under one lock; True if the store changed.
 
-            if strength >= threshold:
-                keep.append(mem)
+    The hot store is read once, every operation is applied to the in-memory
+    list, and the result is written back once if anything changed.
+    """
+    lock_fd = hot_memory_lock()
+    try:
+        memories = read_hot_memories()
+        changed = False
+        pending = []  # consecutive reinforce facts, matched in one pass
+        for op in ops:
+            kind = op.get("op") if isinstance(op, dict) else None
+            if kind == "reinforce" and isinstance(op.get("fact"), str) and op["fact"]:
+                pending.append(op["fact"])
+                continue
+            if pending:
+                changed |= _reinforce_many(memories, pending)
+                pending = []
+            if kind == "prune":
+                dry_run = bool(op.get("dry_run", False))
+                keep = _prune_decayed(memories, op.get("threshold", PRUNE_THRESHOLD), dry_run)
+                if not dry_run and len(keep) < len(memories):
+                    memories = keep
+                    changed = True
             else:
-                pruned.append((mem, strength))
-
-        if pruned:
-            for mem, strength in pruned:
-                log(f"{'PRUNE' if not args.dry_run else 'WOULD PRUNE'}: "
-                    f"{mem.get('fact', '')[:60]}... (strength={strength:.4f})")
+                log_warn(f"Skipping unknown batch operation: {op!r}")
+        if pending:
+            changed |= _reinforce_many(memories, pending)
 
-            if not args.dry_run:
-                write_hot_memories(keep)
-                log(f"Pruned {len(pruned)} memories, kept {len(keep)}")
-            else:
-                log(f"DRY RUN: would prune {len(pruned)}, keep {len(keep)}")
-        else:
-            log(f"No memories below threshold {threshold}")
+        if changed:
+            write_hot_memories(memories)
+            _invalidate_hot_cache()
+            log(f"Batch applied {len(ops)} operations, {len(memories)} memories stored")
+        return changed
     finally:
         hot_memory_unlock(lock_fd)
 
 
+def cmd_batch(args):
+    """Apply a JSON list of reinforce/prune operations from stdin under one lock.
+
+    Example input:
+        [{"op": "reinforce", "fact": "favorite color"},
+         {"op": "prune", "threshold": 0.05}]
+
+    See apply_batch().
+    """
+    load_env()
+
+    try:
+        ops = json_loads(sys.stdin.buffer.read())
+    except json.JSONDecodeError as e:
+        log_error(f"Invalid batch input: {e}")
+        sys.exit(1)
+    if not isinstance(ops, list):
+        log_error("Batch input must be a JSON list of operations")
+        sys.exit(1)
+
+    apply_batch(ops)
+
+
+# ---------------------------------------------------------------------------
+# Daemon
+# ---------------------------------------------------------------------------
+
+def _handle_request(request: dict):
+    """Dispatch one daemon request and return its JSON-serializable result."""
+    if not isinstance(request, dict):
+        raise ValueError("request must be a JSON object")
+    cmd = request.get("cmd")
+    if cmd == "search":
+        query = request.get("query")
+        if not isinstance(query, str):
+            raise ValueError("search needs a query string")
+        limit = int(request.get("limit", 10))
+        given = request.get("weights") or {}
+        weights = {
+            "relevance": float(given.get("relevance", DEFAULT_ALPHA_RELEVANCE)),
+            "importance": float(given.get("importance", DEFAULT_ALPHA_IMPORTANCE)),
+            "recency": float(given.get("recency", DEFAULT_ALPHA_RECENCY)),
+            "decay": float(given.get("decay", DEFAULT_ALPHA_DECAY)),
+        }
+        hot_results = score_hot_memories(query, weights, limit=limit)
+        return _search_document(query, weights, hot_results, search_capsule(query, limit=limit))
+    if cmd == "decay-report":
+        return decay_report()
+    if cmd in ("reinforce", "prune"):
+        return {"changed": apply_batch([dict(request, op=cmd)])}
+    if cmd == "batch":
+        ops = request.get("ops")
+        if not isinstance(ops, list):
+            raise ValueError("batch needs an ops list")
+        return {"changed": apply_batch(ops)}
+    raise ValueError(f"unknown cmd {cmd!r}")
+
+
+def cmd_daemon(args):
+    """Serve search/reinforce/decay-report/prune/batch requests on a Unix socket.
+
+    Keeps the interpreter, numpy and the parsed hot store loaded between
+    requests. Each connection sends one JSON line such as
+    {"cmd": "search", "query": "...", "limit": 5} and receives one JSON line
+    {"ok": true, "result": ...} (or {"ok": false, "error": "..."}).
+    """
+    load_env()
+    _cached_read_hot_memories()
+    socket_daemon.serve_forever(
+        args.socket, _handle_request, "Scorer",
+        log=log, log_warn=log_warn,
+        loads=json_loads, dumps=functools.partial(json_dumps, default=str),
+    )
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -426,6 +883,18 @@ def main():
     p_prune.add_argument("--dry-run", action="store_true")
     p_prune.set_defaults(func=cmd_prune)
 
+    # batch
+    p_batch = subparsers.add_parser(
+        "batch", help="Apply reinforce/prune operations from a JSON list on stdin")
+    p_batch.set_defaults(func=cmd_batch)
+
+    # daemon
+    p_daemon = subparsers.add_parser(
+        "daemon", help="Serve scorer requests on a Unix socket (see scorer-client.sh)")
+    p_daemon.add_argument("--socket", default=SCORER_SOCK,
+                          help=f"Socket path (default: {SCORER_SOCK})")
+    p_daemon.set_defaults(func=cmd_daemon)
+
     args = parser.parse_args()
     if not args.command:
         parser.print_help()
@@ -0,0 +1,27 @@
+#!/bin/bash
+# Usage: ./scorer-client.sh '<json request>'
+# Sends one request to a running "memory-scorer.py daemon" and prints its
+# one-line JSON reply, e.g.:
+#
+#   ./scorer-client.sh '{"cmd": "search", "query": "project status", "limit": 5}'
+#   ./scorer-client.sh '{"cmd": "reinforce", "fact": "favorite color"}'
+#   ./scorer-client.sh '{"cmd": "prune", "threshold": 0.05, "dry_run": true}'
+#   ./scorer-client.sh '{"cmd": "decay-report"}'
+#
+# Requires a netcat with Unix socket support (nc -U).
+
+set -euo pipefail
+
+REQUEST="${1:-}"
+if [ -z "$REQUEST" ]; then
+    echo "Usage: $0 '<json request>'" >&2
+    exit 1
+fi
+
+SOCK="${SCORER_SOCK:-${AETHERVAULT_HOME:-$HOME/.aethervault}/run/scorer.sock}"
+if [ ! -S "$SOCK" ]; then
+    echo "{\"ok\":false,\"error\":\"scorer daemon not running ($SOCK)\"}"
+    exit 1
+fi
+
+printf '%s\n' "$REQUEST" | nc -U "$SOCK"
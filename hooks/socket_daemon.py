@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+AetherVault Socket Daemon — Shared Module
+=========================================
+
+Unix-socket server loop behind the `daemon` subcommands of memory-scorer.py
+and knowledge-graph.py.
+
+Each connection carries exactly one request: the client sends one JSON line
+and receives one JSON line back, {"ok": true, "result": ...} or
+{"ok": false, "error": "..."}. The caller supplies the request handler;
+anything it raises becomes an error response rather than stopping the server.
+"""
+
+import json
+import os
+import signal
+import socket
+import sys
+
+DAEMON_TIMEOUT_SECONDS = 30
+MAX_REQUEST_BYTES = 1 << 20
+
+
+def _log_stderr(msg: str):
+    print(msg, file=sys.stderr, flush=True)
+
+
+def _default_dumps(data) -> bytes:
+    return json.dumps(data, default=str).encode("utf-8")
+
+
+def _serve_connection(conn, handle_request, loads, dumps, max_request_bytes):
+    """Read one JSON request line from conn and write one JSON response line."""
+    conn.settimeout(DAEMON_TIMEOUT_SECONDS)
+    with conn.makefile("rb") as reader:
+        line = reader.readline(max_request_bytes)
+    if not line:  # closed without a request, e.g. another daemon's liveness probe
+        return
+    # Serializing the result is inside the try too: orjson rejects non-str
+    # keys and ints wider than 64 bits, and that must not stop the server
+    try:
+        payload = dumps({"ok": True, "result": handle_request(loads(line))})
+    except Exception as e:  # a bad request must not take the daemon down
+        payload = dumps({"ok": False, "error": str(e)})
+    conn.sendall(payload + b"\n")
+
+
+def _is_live(sock_path: str) -> bool:
+    """True if a server is accepting connections on sock_path."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(sock_path)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def serve_forever(sock_path: str, handle_request, name: str,
+                  log=_log_stderr, log_warn=_log_stderr,
+                  loads=json.loads, dumps=_default_dumps,
+                  max_request_bytes: int = MAX_REQUEST_BYTES):
+    """Serve handle_request on a Unix socket at sock_path until SIGTERM or Ctrl-C.
+
+    dumps must return bytes. The socket is created owner-only and removed
+    on exit. Exits with status 1 if another daemon is already serving
+    sock_path; a stale socket file left by a crashed daemon is replaced.
+    """
+    os.makedirs(os.path.dirname(sock_path), exist_ok=True)
+    if _is_live(sock_path):
+        log_warn(f"{name} daemon already running on {sock_path}, not starting")
+        sys.exit(1)
+    try:
+        os.unlink(sock_path)
+    except FileNotFoundError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.bind(sock_path)
+        os.chmod(sock_path, 0o600)
+        server.listen(16)
+        log(f"{name} daemon listening on {sock_path}")
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    _serve_connection(conn, handle_request, loads, dumps, max_request_bytes)
+                except OSError as e:
+                    log_warn(f"Daemon connection failed: {e}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        try:
+            os.unlink(sock_path)
+        except FileNotFoundError:
+            pass
+        log(f"{name} daemon stopped")
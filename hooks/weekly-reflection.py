@@ -225,14 +225,17 @@ def generate_insight(api_key: str, question: str, evidence: list) -> dict:
 
 def store_reflection_memory(insight: str, question: str, week_id: str):
     """Write a reflection insight to the hot memory buffer (via shared module)."""
-    now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    now = datetime.datetime.now(datetime.timezone.utc)
+    now_iso = now.isoformat()
     importance_norm = REFLECTION_IMPORTANCE / 10.0
     metadata = {
         "category": "reflection",
         "importance": REFLECTION_IMPORTANCE,
         "importance_normalized": importance_norm,
         "created_at": now_iso,
+        "created_at_epoch": now.timestamp(),
         "last_accessed": now_iso,
+        "last_accessed_epoch": now.timestamp(),
         "access_count": 0,
         "decay_strength": 1.0,
         "decay_layer": "ltm" if importance_norm >= PROMOTE_THRESHOLD else "stm",
@@ -25,16 +25,27 @@ Cron schedule (add via `crontab -e`):
     0 9 * * 0,6 /root/.aethervault/hooks/morning-briefing.sh
 """
 
+import hashlib
 import json
 import os
+import re
+import shutil
+import socket
 import subprocess
 import sys
 import urllib.error
-import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# orjson is optional; it serializes the API payloads and parses responses faster
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -51,6 +62,15 @@ AETHERVAULT_DIR = Path(AETHERVAULT_HOME)
 DAILY_SUMMARIES_DIR = AETHERVAULT_DIR / "workspace" / "daily-summaries"
 KNOWLEDGE_GRAPH_SCRIPT = AETHERVAULT_DIR / "hooks" / "knowledge-graph.py"
 KNOWLEDGE_GRAPH_FILE = AETHERVAULT_DIR / "data" / "knowledge-graph.json"
+# Served by `knowledge-graph.py daemon` when it is running
+KNOWLEDGE_GRAPH_SOCK = AETHERVAULT_DIR / "run" / "knowledge-graph.sock"
+# Parsed source results keyed on the source file's mtime/size (see _cached_source)
+SOURCE_CACHE_DIR = AETHERVAULT_DIR / "data" / "briefing-cache"
+# Last generated briefing keyed on a hash of the Claude request (see generate_briefing)
+BRIEFING_CACHE_FILE = SOURCE_CACHE_DIR / "briefing.json"
+
+# Date format of summary/briefing file names and the gcalcli agenda range
+DATE_FMT = "%Y-%m-%d"
 
 WEATHER_LOCATION = os.environ.get("WEATHER_LOCATION", "")
 WEATHER_URL = f"https://wttr.in/{WEATHER_LOCATION}?format=3" if WEATHER_LOCATION else ""
@@ -62,6 +82,77 @@ def log(msg: str):
     print(f"[{ts}] {msg}", flush=True)
 
 
+def _json_dumps(data) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _json_loads(data):
+    """Parse JSON from bytes or str."""
+    if HAS_ORJSON:
+        return orjson.loads(data)  # orjson.JSONDecodeError subclasses ValueError
+    return json.loads(data)
+
+
+# One opener for the Claude and Telegram posts; unlike a bare http.client
+# connection it honours HTTPS_PROXY/https_proxy from the environment
+_opener = urllib.request.build_opener()
+
+
+def _post_json(url: str, body: bytes, headers: dict, timeout: int) -> tuple:
+    """POST a JSON body and return (status, response bytes).
+
+    HTTP error statuses are returned, not raised.
+    """
+    req = urllib.request.Request(
+        url,
+        data=body,
+        headers={"Content-Type": "application/json", **headers},
+        method="POST",
+    )
+    try:
+        with _opener.open(req, timeout=timeout) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        try:
+            return e.code, e.read()
+        except Exception:
+            return e.code, b""
+
+
+def _run_cli(args: list, timeout: int) -> subprocess.CompletedProcess:
+    """subprocess.run() for the gatherer CLIs, set up for CPython's posix_spawn fast path.
+
+    CPython only spawns via posix_spawn (no fork of this process) when the
+    executable is a full path and close_fds is False; descriptors opened by
+    Python are non-inheritable anyway (PEP 446). Raises FileNotFoundError
+    when the command isn't on PATH, like subprocess.run().
+
+    Output is captured as bytes and decoded once as UTF-8 (invalid bytes
+    replaced) with newlines normalized, so stdout/stderr are str as with
+    text=True but never depend on the locale cron runs under.
+    """
+    executable = shutil.which(args[0])
+    if executable is None:
+        raise FileNotFoundError(f"{args[0]} not found on PATH")
+    result = subprocess.run(
+        [executable, *args[1:]],
+        capture_output=True,
+        timeout=timeout,
+        close_fds=False,
+    )
+    result.stdout = _decode_output(result.stdout)
+    result.stderr = _decode_output(result.stderr)
+    return result
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured CLI output the way text=True would, but always as UTF-8."""
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
 # ---------------------------------------------------------------------------
 # Data Gathering — each function returns (str, bool) where bool = success
 # ---------------------------------------------------------------------------
@@ -88,12 +179,7 @@ def gather_weather() -> tuple:
 def gather_emails() -> tuple:
     """Fetch the last 5 emails via Himalaya CLI."""
     try:
-        result = subprocess.run(
-            ["himalaya", "list", "-s", "5"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        result = _run_cli(["himalaya", "list", "-s", "5"], timeout=30)
         if result.returncode != 0:
             log(f"Himalaya failed (rc={result.returncode}): {result.stderr.strip()}")
             return "", False
@@ -116,21 +202,19 @@ def gather_emails() -> tuple:
 def gather_active_projects() -> tuple:
     """Query the knowledge graph for active projects."""
     try:
-        result = subprocess.run(
-            [
-                "python3",
-                str(KNOWLEDGE_GRAPH_SCRIPT),
-                "query",
-                "--type", "project",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=15,
-        )
-        if result.returncode != 0:
-            # Fallback: try reading the knowledge graph file directly
-            return _read_knowledge_graph_fallback()
-        output = result.stdout.strip()
+        # A running knowledge-graph daemon answers without a Python startup
+        # and graph load; otherwise run the CLI as before
+        output = _query_knowledge_graph_daemon({"cmd": "query", "type": "project"})
+        if output is None:
+            result = _run_cli(
+                ["python3", str(KNOWLEDGE_GRAPH_SCRIPT), "query", "--type", "project"],
+                timeout=15,
+            )
+            if result.returncode != 0:
+                # Fallback: try reading the knowledge graph file directly
+                return _read_knowledge_graph_fallback()
+            output = result.stdout
+        output = output.strip()
         if not output:
             return "No active projects found.", True
         log(f"Active projects fetched ({len(output)} chars)")
@@ -145,45 +229,113 @@ def gather_active_projects() -> tuple:
         return _read_knowledge_graph_fallback()
 
 
+def _query_knowledge_graph_daemon(request: dict, timeout: int = 5):
+    """Send one request to the knowledge-graph daemon; None if it isn't usable."""
+    if not KNOWLEDGE_GRAPH_SOCK.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(KNOWLEDGE_GRAPH_SOCK))
+            sock.sendall(_json_dumps(request) + b"\n")
+            with sock.makefile("rb") as reader:
+                response = _json_loads(reader.readline())
+    except (OSError, ValueError) as e:
+        log(f"Knowledge graph daemon unavailable ({e}), using CLI")
+        return None
+    if not response.get("ok"):
+        log(f"Knowledge graph daemon error: {response.get('error')}")
+        return None
+    return response.get("result")
+
+
 def _read_knowledge_graph_fallback() -> tuple:
     """Read the knowledge graph JSON directly to extract active projects."""
     try:
         if not KNOWLEDGE_GRAPH_FILE.exists():
             log("Knowledge graph file not found")
             return "", False
-        with open(KNOWLEDGE_GRAPH_FILE, "r") as f:
-            data = json.load(f)
-        # Extract nodes that look like active projects
-        projects = []
-        nodes = data.get("nodes", [])
-        for node in nodes:
-            node_data = node.get("data", node)
-            node_type = node_data.get("type", "")
-            props = node_data.get("properties", {})
-            status = props.get("status", "")
-            name = node_data.get("name", node_data.get("id", "unknown"))
-            if node_type == "project" and status in ("active", "in-progress", ""):
-                desc = props.get("description", "no description")
-                projects.append(f"- {name}: {desc}")
-        if not projects:
-            return "No active projects found in knowledge graph.", True
-        output = "Active projects:\n" + "\n".join(projects)
-        log(f"Extracted {len(projects)} projects from knowledge graph")
-        return output, True
+        return _cached_source("knowledge-graph-projects", KNOWLEDGE_GRAPH_FILE,
+                              _extract_active_projects)
     except Exception as e:
         log(f"Knowledge graph fallback failed: {e}")
         return "", False
 
 
+def _iter_graph_nodes():
+    """Yield the knowledge graph's nodes, streamed one at a time when ijson is installed."""
+    # ijson is optional and imported here rather than at startup: only the
+    # fallback path reads the graph file, and most runs never take it
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+    if ijson is not None:
+        with open(KNOWLEDGE_GRAPH_FILE, "rb") as f:
+            yield from ijson.items(f, "nodes.item", use_float=True)
+    else:
+        with open(KNOWLEDGE_GRAPH_FILE, "rb") as f:
+            data = _json_loads(f.read())
+        yield from data.get("nodes", [])
+
+
+def _extract_active_projects() -> tuple:
+    """Parse the knowledge graph file and list its active project nodes."""
+    # Extract nodes that look like active projects
+    projects = []
+    for node in _iter_graph_nodes():
+        node_data = node.get("data", node)
+        node_type = node_data.get("type", "")
+        props = node_data.get("properties", {})
+        status = props.get("status", "")
+        name = node_data.get("name", node_data.get("id", "unknown"))
+        if node_type == "project" and status in ("active", "in-progress", ""):
+            desc = props.get("description", "no description")
+            projects.append(f"- {name}: {desc}")
+    if not projects:
+        return "No active projects found in knowledge graph.", True
+    output = "Active projects:\n" + "\n".join(projects)
+    log(f"Extracted {len(projects)} projects from knowledge graph")
+    return output, True
+
+
+def _cached_source(name: str, path: Path, build) -> tuple:
+    """Return build()'s (text, ok), reusing the stored result while path is unchanged.
+
+    Results are kept in SOURCE_CACHE_DIR/<name>.json keyed on the source
+    file's mtime and size, so same-day reruns skip re-parsing it.
+    """
+    st = path.stat()
+    key = [str(path), st.st_mtime_ns, st.st_size]
+    cache_path = SOURCE_CACHE_DIR / f"{name}.json"
+    try:
+        cached = _json_loads(cache_path.read_bytes())
+        if isinstance(cached, dict) and cached.get("key") == key:
+            log(f"Using cached {name} ({path.name} unchanged)")
+            return cached["value"][0], cached["value"][1]
+    except (OSError, ValueError, KeyError, IndexError, TypeError):
+        pass
+
+    value = build()
+    if value[1]:
+        try:
+            SOURCE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_bytes(_json_dumps({"key": key, "value": list(value)}))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            log(f"Could not write {name} cache: {e}")
+    return value
+
+
 def gather_calendar() -> tuple:
     """Check today's calendar events via gcalcli or Google Calendar API."""
+    now = datetime.now()
     try:
-        result = subprocess.run(
+        result = _run_cli(
             ["gcalcli", "agenda", "--nocolor", "--tsv",
-             datetime.now().strftime("%Y-%m-%d"),
-             (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")],
-            capture_output=True,
-            text=True,
+             now.strftime(DATE_FMT),
+             (now + timedelta(days=1)).strftime(DATE_FMT)],
             timeout=15,
         )
         if result.returncode != 0:
@@ -208,7 +360,7 @@ def gather_calendar() -> tuple:
 def gather_yesterday_summary() -> tuple:
     """Read yesterday's daily summary if it exists."""
     try:
-        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        yesterday = (datetime.now() - timedelta(days=1)).strftime(DATE_FMT)
         summary_path = DAILY_SUMMARIES_DIR / f"summary-{yesterday}.md"
         if not summary_path.exists():
             # Try alternate naming conventions
@@ -235,6 +387,29 @@ def gather_yesterday_summary() -> tuple:
 # Claude API — Generate the briefing
 # ---------------------------------------------------------------------------
 
+# Both prompts are fixed for the process, so they are built once here
+SYSTEM_PROMPT = (
+    f"You are the AetherVault personal AI assistant for {OWNER_NAME}. "
+    "You write concise, warm morning briefings. Your tone is like a trusted "
+    "chief of staff — efficient, personal, never sycophantic or cheesy. "
+    "You highlight what matters and skip what doesn't."
+)
+
+FORMAT_INSTRUCTIONS = """Format the briefing for Telegram using Markdown:
+- Use *bold* for section headers (Telegram uses single asterisks for bold)
+- Use bullet points with - or bullet characters
+- Keep it concise — aim for 200-400 words max
+- No fluff, no corporate speak
+
+Structure:
+1. A brief, warm greeting (one line, reference the weather if available)
+2. *Schedule* — today's calendar events (or "clear day" if none)
+3. *Inbox* — emails that need attention (skip routine ones)
+4. *Active Projects* — brief status on what's moving
+5. *From Yesterday* — anything carried over or noteworthy
+6. A closing line — something genuine and motivating, not a fortune cookie"""
+
+
 def generate_briefing(context: dict) -> str:
     """Call Claude API to generate the morning briefing."""
     if not ANTHROPIC_API_KEY:
@@ -271,57 +446,43 @@ def generate_briefing(context: dict) -> str:
 
     compiled_context = "\n\n---\n\n".join(sections) if sections else "No data sources were available."
 
-    system_prompt = (
-        f"You are the AetherVault personal AI assistant for {OWNER_NAME}. "
-        "You write concise, warm morning briefings. Your tone is like a trusted "
-        "chief of staff — efficient, personal, never sycophantic or cheesy. "
-        "You highlight what matters and skip what doesn't."
-    )
-
     user_prompt = f"""Write a morning briefing for {day_name}, {date_str}.
 {"It's the weekend, so keep it lighter." if is_weekend else ""}
 
-Format the briefing for Telegram using Markdown:
-- Use *bold* for section headers (Telegram uses single asterisks for bold)
-- Use bullet points with - or bullet characters
-- Keep it concise — aim for 200-400 words max
-- No fluff, no corporate speak
-
-Structure:
-1. A brief, warm greeting (one line, reference the weather if available)
-2. *Schedule* — today's calendar events (or "clear day" if none)
-3. *Inbox* — emails that need attention (skip routine ones)
-4. *Active Projects* — brief status on what's moving
-5. *From Yesterday* — anything carried over or noteworthy
-6. A closing line — something genuine and motivating, not a fortune cookie
+{FORMAT_INSTRUCTIONS}
 
 Here is today's context:
 
 {compiled_context}"""
 
-    request_body = json.dumps({
+    request_body = _json_dumps({
         "model": CLAUDE_MODEL,
         "max_tokens": 1024,
-        "system": system_prompt,
+        "system": SYSTEM_PROMPT,
         "messages": [
             {"role": "user", "content": user_prompt}
         ],
-    }).encode("utf-8")
+    })
 
-    req = urllib.request.Request(
-        CLAUDE_API_URL,
-        data=request_body,
-        headers={
-            "Content-Type": "application/json",
-            "x-api-key": ANTHROPIC_API_KEY,
-            "anthropic-version": "2023-06-01",
-        },
-        method="POST",
-    )
+    # The request embeds the date and every source, so an identical body means
+    # a rerun (cron retry, double fire) that would get the same briefing back
+    request_hash = hashlib.blake2b(request_body, digest_size=16).hexdigest()
+    cached = _load_cached_briefing(request_hash)
+    if cached:
+        log("Context unchanged since last run, reusing cached briefing")
+        return cached
 
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
+        status, body = _post_json(
+            CLAUDE_API_URL,
+            request_body,
+            {"x-api-key": ANTHROPIC_API_KEY, "anthropic-version": "2023-06-01"},
+            timeout=60,
+        )
+        if status >= 400:
+            log(f"Claude API error {status}: {body.decode('utf-8', errors='replace')[:500]}")
+            return _fallback_briefing(context)
+        data = _json_loads(body)
         # Extract text from response
         content_blocks = data.get("content", [])
         text_parts = []
@@ -333,16 +494,35 @@ Here is today's context:
             log("Claude returned empty response")
             return _fallback_briefing(context)
         log(f"Briefing generated ({len(briefing)} chars)")
+        _store_cached_briefing(request_hash, briefing)
         return briefing
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace")
-        log(f"Claude API error {e.code}: {body[:500]}")
-        return _fallback_briefing(context)
     except Exception as e:
         log(f"Claude API call failed: {e}")
         return _fallback_briefing(context)
 
 
+def _load_cached_briefing(request_hash: str) -> str:
+    """Return the stored briefing if it was generated from this exact request."""
+    try:
+        cached = _json_loads(BRIEFING_CACHE_FILE.read_bytes())
+        if isinstance(cached, dict) and cached.get("hash") == request_hash:
+            return cached.get("briefing", "")
+    except (OSError, ValueError):
+        pass
+    return ""
+
+
+def _store_cached_briefing(request_hash: str, briefing: str):
+    """Remember the briefing generated for request_hash (best effort)."""
+    try:
+        SOURCE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = BRIEFING_CACHE_FILE.with_suffix(".tmp")
+        tmp_path.write_bytes(_json_dumps({"hash": request_hash, "briefing": briefing}))
+        os.replace(tmp_path, BRIEFING_CACHE_FILE)
+    except OSError as e:
+        log(f"Could not write briefing cache: {e}")
+
+
 def _fallback_briefing(context: dict) -> str:
     """Generate a basic briefing without Claude if the API is unavailable."""
     today = datetime.now()
@@ -390,34 +570,31 @@ def send_telegram(message: str) -> bool:
 
     success = True
     for i, chunk in enumerate(chunks):
-        payload = json.dumps({
+        text = _escape_markdown(chunk)
+        if len(text) > TELEGRAM_MAX_LENGTH:
+            text = chunk  # escaping pushed it over the limit; send as written
+        payload = _json_dumps({
             "chat_id": TELEGRAM_CHAT_ID,
-            "text": chunk,
+            "text": text,
             "parse_mode": "Markdown",
             "disable_web_page_preview": True,
-        }).encode("utf-8")
-
-        req = urllib.request.Request(
-            url,
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
+        })
 
         try:
-            with urllib.request.urlopen(req, timeout=15) as resp:
-                result = json.loads(resp.read().decode("utf-8"))
+            status, body = _post_json(url, payload, {}, timeout=15)
+            if status >= 400:
+                log(f"Telegram API error {status}: "
+                    f"{body.decode('utf-8', errors='replace')[:300]}")
+                # Retry without Markdown parsing
+                success = _send_telegram_plain(chunk)
+                continue
+            result = _json_loads(body)
             if not result.get("ok"):
                 log(f"Telegram API returned not-ok: {result}")
                 # Retry without Markdown if parsing failed
                 success = _send_telegram_plain(chunk)
             else:
                 log(f"Telegram message sent (chunk {i + 1}/{len(chunks)})")
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace")
-            log(f"Telegram API error {e.code}: {body[:300]}")
-            # Retry without Markdown parsing
-            success = _send_telegram_plain(chunk)
         except Exception as e:
             log(f"Telegram send failed: {e}")
             success = False
@@ -428,22 +605,15 @@ def send_telegram(message: str) -> bool:
 def _send_telegram_plain(message: str) -> bool:
     """Retry sending without Markdown if formatting causes issues."""
     url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-    payload = json.dumps({
+    payload = _json_dumps({
         "chat_id": TELEGRAM_CHAT_ID,
         "text": message,
         "disable_web_page_preview": True,
-    }).encode("utf-8")
-
-    req = urllib.request.Request(
-        url,
-        data=payload,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
+    })
 
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
+        status, body = _post_json(url, payload, {}, timeout=15)
+        result = _json_loads(body)
         if result.get("ok"):
             log("Telegram message sent (plain text fallback)")
             return True
@@ -454,22 +624,41 @@ def _send_telegram_plain(message: str) -> bool:
         return False
 
 
+# Telegram's legacy Markdown treats a stray _ or [ outside an entity as the
+# start of italics or a link and rejects the whole message. One pass keeps
+# *bold*, `code` and [text](url) link spans intact and backslash-escapes those
+# characters elsewhere
+_MARKDOWN_RESERVED = re.compile(r"(\*[^*\n]*\*|`[^`\n]*`|\[[^\]\n]*\]\([^)\n]*\))|([_\[])")
+TELEGRAM_MAX_LENGTH = 4096
+
+
+def _escape_markdown(text: str) -> str:
+    """Escape Telegram Markdown's reserved _ and [ outside bold, code and link spans."""
+    return _MARKDOWN_RESERVED.sub(lambda m: m.group(1) or "\\" + m.group(2), text)
+
+
 def _split_message(text: str, max_length: int = 4000) -> list:
     """Split a message into chunks that fit within Telegram's character limit."""
     if len(text) <= max_length:
         return [text]
 
+    # Track the chunk as a slice of lines plus its running length instead of
+    # growing a string; each chunk is joined once
+    lines = text.split("\n")
     chunks = []
-    current = ""
-    for line in text.split("\n"):
-        if len(current) + len(line) + 1 > max_length:
-            if current:
-                chunks.append(current.strip())
-            current = line + "\n"
+    start = 0
+    size = 0
+    for i, line in enumerate(lines):
+        line_size = len(line) + 1
+        if size + line_size > max_length:
+            if size:
+                chunks.append("\n".join(lines[start:i]).strip())
+            start, size = i, line_size
         else:
-            current += line + "\n"
-    if current.strip():
-        chunks.append(current.strip())
+            size += line_size
+    tail = "\n".join(lines[start:]).strip()
+    if tail:
+        chunks.append(tail)
 
     return chunks if chunks else [text[:max_length]]
 
@@ -482,13 +671,16 @@ def save_briefing(briefing: str) -> str:
     """Save the briefing as a markdown file in the daily summaries directory."""
     try:
         DAILY_SUMMARIES_DIR.mkdir(parents=True, exist_ok=True)
-        today = datetime.now().strftime("%Y-%m-%d")
-        filepath = DAILY_SUMMARIES_DIR / f"briefing-{today}.md"
+        # One clock read, so the file name and header agree across midnight
+        now = datetime.now()
+        filepath = DAILY_SUMMARIES_DIR / f"briefing-{now.strftime(DATE_FMT)}.md"
 
-        header = f"# Morning Briefing — {datetime.now().strftime('%A, %B %d, %Y')}\n\n"
-        header += f"Generated at {datetime.now().strftime('%H:%M:%S')}\n\n---\n\n"
+        header = f"# Morning Briefing — {now.strftime('%A, %B %d, %Y')}\n\n"
+        header += f"Generated at {now.strftime('%H:%M:%S')}\n\n---\n\n"
 
-        filepath.write_text(header + briefing)
+        # Encode explicitly: write_text() would use the locale encoding, which
+        # under cron's C locale cannot represent the em dash in the header
+        filepath.write_bytes((header + briefing).encode("utf-8"))
         log(f"Briefing saved to {filepath}")
         return str(filepath)
     except Exception as e:
@@ -500,6 +692,16 @@ def save_briefing(briefing: str) -> str:
 # Main
 # ---------------------------------------------------------------------------
 
+# (context key, name when unavailable, gatherer) in briefing order
+CONTEXT_SOURCES = [
+    ("weather", "weather", gather_weather),
+    ("emails", "email", gather_emails),
+    ("projects", "knowledge graph", gather_active_projects),
+    ("calendar", "calendar", gather_calendar),
+    ("yesterday_summary", "yesterday's summary", gather_yesterday_summary),
+]
+
+
 def main():
     log("=" * 50)
     log("AetherVault Morning Briefing")
@@ -511,43 +713,20 @@ def main():
     if not ANTHROPIC_API_KEY:
         log("WARNING: ANTHROPIC_API_KEY not set — will use fallback briefing format")
 
-    # Gather all context sources
+    # Gather all context sources concurrently — each one is an independent
+    # network or subprocess wait, so the total is the slowest, not the sum
     context = {"unavailable": []}
 
-    log("Gathering weather...")
-    weather, ok = gather_weather()
-    if ok:
-        context["weather"] = weather
-    else:
-        context["unavailable"].append("weather")
-
-    log("Gathering emails...")
-    emails, ok = gather_emails()
-    if ok:
-        context["emails"] = emails
-    else:
-        context["unavailable"].append("email")
-
-    log("Gathering active projects...")
-    projects, ok = gather_active_projects()
-    if ok:
-        context["projects"] = projects
-    else:
-        context["unavailable"].append("knowledge graph")
-
-    log("Gathering calendar...")
-    calendar, ok = gather_calendar()
-    if ok:
-        context["calendar"] = calendar
-    else:
-        context["unavailable"].append("calendar")
+    log("Gathering weather, emails, projects, calendar and yesterday's summary...")
+    with ThreadPoolExecutor(max_workers=len(CONTEXT_SOURCES)) as pool:
+        futures = [pool.submit(gather) for _, _, gather in CONTEXT_SOURCES]
 
-    log("Gathering yesterday's summary...")
-    yesterday, ok = gather_yesterday_summary()
-    if ok:
-        context["yesterday_summary"] = yesterday
-    else:
-        context["unavailable"].append("yesterday's summary")
+    for (key, label, _), future in zip(CONTEXT_SOURCES, futures):
+        value, ok = future.result()
+        if ok:
+            context[key] = value
+        else:
+            context["unavailable"].append(label)
 
     # Generate briefing
     log("Generating briefing via Claude...")
@@ -557,17 +736,20 @@ def main():
         log("ERROR: Failed to generate briefing")
         sys.exit(1)
 
-    # Save to disk
-    save_path = save_briefing(briefing)
+    # Save to disk on a worker thread while Telegram sends
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        save_future = pool.submit(save_briefing, briefing)
 
-    # Send via Telegram
-    if TELEGRAM_BOT_TOKEN:
-        log("Sending via Telegram...")
-        sent = send_telegram(briefing)
-        if not sent:
-            log("WARNING: Telegram send failed — briefing saved locally")
-    else:
-        log("Skipping Telegram (no bot token)")
+        # Send via Telegram
+        if TELEGRAM_BOT_TOKEN:
+            log("Sending via Telegram...")
+            sent = send_telegram(briefing)
+            if not sent:
+                log("WARNING: Telegram send failed — briefing saved locally")
+        else:
+            log("Skipping Telegram (no bot token)")
+
+    save_path = save_future.result()
 
     log("Morning briefing complete")
     if save_path:
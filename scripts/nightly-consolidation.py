@@ -470,65 +470,63 @@ def update_knowledge_graph(entities: list, relations: list,
 
 def _update_kg_via_hook(entities: list, relations: list,
                         target_date: str, dry_run: bool):
-    """Update knowledge graph by calling knowledge-graph.py hook."""
+    """Update knowledge graph with one knowledge-graph.py batch call.
+
+    All entities and relations go to the hook's batch subcommand as a single
+    JSON document on stdin, so the day's updates cost one interpreter start
+    and one graph transaction instead of one subprocess per item.
+    """
+    batch_entities = []
     for entity in entities:
         name = entity.get("name", "").strip()
         etype = entity.get("type", "concept").strip()
         desc = entity.get("description", "").strip()
         if not name:
             continue
-
-        cmd = [
-            sys.executable, KNOWLEDGE_GRAPH_HOOK,
-            "add-entity",
-            "--name", name,
-            "--type", etype,
-        ]
+        item = {"name": name, "type": etype}
         if desc:
-            cmd.extend(["--attrs", json.dumps({"description": desc})])
-
-        if dry_run:
-            log(f"DRY RUN - would run: {' '.join(cmd)}")
-            continue
-
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode != 0:
-                log_warn(f"knowledge-graph.py add-entity failed for '{name}': "
-                         f"{result.stderr.strip()}")
-            else:
-                log(f"Added entity: {name} ({etype})")
-        except Exception as e:
-            log_warn(f"Failed to add entity '{name}': {e}")
+            item["attrs"] = {"description": desc}
+        batch_entities.append(item)
 
+    batch_relations = []
     for relation in relations:
         from_ent = relation.get("from", "").strip()
         rel_type = relation.get("relation", "").strip()
         to_ent = relation.get("to", "").strip()
         if not (from_ent and rel_type and to_ent):
             continue
+        batch_relations.append({"from": from_ent, "relation": rel_type, "to": to_ent})
 
-        cmd = [
-            sys.executable, KNOWLEDGE_GRAPH_HOOK,
-            "add-relation",
-            "--from", from_ent,
-            "--relation", rel_type,
-            "--to", to_ent,
-        ]
+    if not batch_entities and not batch_relations:
+        return
 
-        if dry_run:
-            log(f"DRY RUN - would run: {' '.join(cmd)}")
-            continue
+    if dry_run:
+        for item in batch_entities:
+            log(f"DRY RUN - would add entity: {item['name']} ({item['type']})")
+        for item in batch_relations:
+            log(f"DRY RUN - would add relation: {item['from']} --[{item['relation']}]--> {item['to']}")
+        return
 
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode != 0:
-                log_warn(f"knowledge-graph.py add-relation failed for "
-                         f"'{from_ent} -> {to_ent}': {result.stderr.strip()}")
-            else:
-                log(f"Added relation: {from_ent} --[{rel_type}]--> {to_ent}")
-        except Exception as e:
-            log_warn(f"Failed to add relation '{from_ent} -> {to_ent}': {e}")
+    batch = {"entities": batch_entities, "relations": batch_relations}
+    cmd = [sys.executable, KNOWLEDGE_GRAPH_HOOK, "batch"]
+    try:
+        result = subprocess.run(cmd, input=json.dumps(batch), capture_output=True,
+                                text=True, timeout=60)
+    except Exception as e:
+        log_warn(f"knowledge-graph.py batch failed for {len(batch_entities)} entities "
+                 f"and {len(batch_relations)} relations: {e}")
+        return
+    if result.returncode != 0:
+        # The batch is one transaction, so nothing was applied
+        names = ", ".join(item["name"] for item in batch_entities)
+        log_warn(f"knowledge-graph.py batch failed (entities: {names or 'none'}): "
+                 f"{result.stderr.strip()}")
+        return
+    for item in batch_entities:
+        log(f"Added entity: {item['name']} ({item['type']})")
+    for item in batch_relations:
+        log(f"Added relation: {item['from']} --[{item['relation']}]--> {item['to']}")
+    log(result.stdout.strip())
 
 
 def _update_kg_direct(entities: list, relations: list,
@@ -604,6 +602,10 @@ def _update_kg_direct(entities: list, relations: list,
             "relation": rel_type,
             "confidence": 0.8,
             "created_at": now_ts,
+            "t_valid": now_ts,
+            "t_invalid": None,
+            "t_created": now_ts,
+            "t_expired": None,
         }
         if dry_run:
             log(f"DRY RUN - would add relation: {from_ent} --[{rel_type}]--> {to_ent}")